@@ -0,0 +1,169 @@
+# backends.py
+# Реестр реализаций БПФ и автоматический выбор самой быстрой для данного размера.
+# Калибровка один раз замеряет все реализации на сетке размеров и сохраняет
+# лучшую для каждого размера в локальный файл; диспетчер fft() выбирает по нему.
+
+import json
+import math
+import os
+
+import numpy as np
+
+from benchmark import make_input, measure
+from fft_engine import fft as engine_fft
+from fft_engine import fft_radix2, is_power_of_two
+
+# Файл с результатами калибровки
+CALIBRATION_FILE = os.path.join(os.path.expanduser("~"), ".bpf_fft_calibration.json")
+
+# Размеры калибровки: степени двойки и «гладкие»/простые размеры между ними
+CALIBRATION_SIZES = [16, 64, 100, 256, 1000, 1024, 4096, 4801, 16384, 48000, 65536, 1 << 18]
+
+# Реализация по умолчанию, пока калибровка не выполнена
+DEFAULT_BACKEND = "vectorized"
+
+
+class Backend:
+    """Реализация БПФ в реестре.
+
+    func(x) - БПФ по последней оси; batched - умеет ли func обрабатывать
+    массивы (..., N); supports(N) - поддерживается ли размер N.
+    """
+
+    def __init__(self, name, func, batched=True, supports=None, max_size=None):
+        self.name = name
+        self.func = func
+        self.batched = batched
+        self._supports = supports
+        self.max_size = max_size
+
+    def __repr__(self):
+        return f"Backend('{self.name}')"
+
+    def supports(self, N):
+        if self.max_size is not None and N > self.max_size:
+            return False
+        return self._supports is None or self._supports(N)
+
+    def __call__(self, x):
+        if self.batched or x.ndim == 1:
+            return self.func(x)
+        rows = x.reshape(-1, x.shape[-1])
+        return np.array([self.func(row) for row in rows]).reshape(x.shape)
+
+
+_registry = {}
+_calibration = None
+
+
+def register_backend(name, func, batched=True, supports=None, max_size=None):
+    """Добавить (или заменить) реализацию в реестре"""
+    _registry[name] = Backend(name, func, batched, supports, max_size)
+
+
+def available_backends():
+    """Имена зарегистрированных реализаций"""
+    return list(_registry)
+
+
+def get_backend(name):
+    if name not in _registry:
+        raise ValueError(f"Неизвестная реализация БПФ '{name}', доступны: {', '.join(_registry)}")
+    return _registry[name]
+
+
+register_backend("vectorized", engine_fft)
+register_backend("radix2", fft_radix2, supports=is_power_of_two)
+register_backend("numpy", np.fft.fft)
+try:
+    import scipy.fft
+except ImportError:
+    pass
+else:
+    register_backend("scipy", scipy.fft.fft)
+
+
+def calibrate(sizes=CALIBRATION_SIZES, path=CALIBRATION_FILE, trials=7, progress=None):
+    """Замерить все реализации на сетке размеров и сохранить лучшую для каждого размера"""
+    timings = {}
+    best = {}
+    cases = [(n, backend) for n in sizes for backend in _registry.values() if backend.supports(n)]
+    for i, (n, backend) in enumerate(cases):
+        if progress is not None:
+            progress(i + 1, len(cases))
+        samples, _ = measure(backend, make_input(n), trials=trials, warmup=2)
+        median = float(np.median(samples))
+        timings.setdefault(str(n), {})[backend.name] = median
+        if str(n) not in best or median < timings[str(n)][best[str(n)]]:
+            best[str(n)] = backend.name
+
+    calibration = {"best": best, "timings_ns": timings}
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(calibration, f, indent=2, ensure_ascii=False)
+    set_calibration(calibration)
+    return calibration
+
+
+def load_calibration(path=CALIBRATION_FILE):
+    """Загрузить калибровку из файла (None, если файла нет)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        calibration = json.load(f)
+    set_calibration(calibration)
+    return calibration
+
+
+def set_calibration(calibration):
+    global _calibration
+    _calibration = calibration
+
+
+def crossover_points(calibration=None):
+    """Размеры, на которых меняется лучшая реализация: [(N, имя), ...]"""
+    calibration = calibration or _calibration
+    if not calibration:
+        return []
+    points = []
+    for n, name in sorted(((int(n), name) for n, name in calibration["best"].items())):
+        if not points or points[-1][1] != name:
+            points.append((n, name))
+    return points
+
+
+def select_backend(N):
+    """Лучшая реализация для размера N по ближайшему (в log2) откалиброванному размеру.
+
+    Степени двойки сравниваются только со степенями двойки, остальные
+    размеры - только с остальными: время алгоритмов для них различается.
+    """
+    global _calibration
+    if _calibration is None:
+        _calibration = load_calibration() or {"best": {}}
+
+    candidates = [(abs(math.log2(int(n)) - math.log2(N)), name)
+                  for n, name in _calibration["best"].items()
+                  if is_power_of_two(int(n)) == is_power_of_two(N)
+                  and name in _registry and _registry[name].supports(N)]
+    if not candidates:
+        return get_backend(DEFAULT_BACKEND)
+    return get_backend(min(candidates)[1])
+
+
+def resolve_backend(N, backend=None):
+    """Реализация для размера N: названная, если она поддерживает N, иначе выбранная автоматически.
+
+    Например, radix2 для N = 1000 или recursive сверх max_size заменяются
+    лучшей реализацией для N по калибровке.
+    """
+    chosen = get_backend(backend) if backend else None
+    if chosen is None or not chosen.supports(N):
+        chosen = select_backend(N)
+    return chosen
+
+
+def fft(x, axis=-1, backend=None):
+    """БПФ вдоль оси axis через указанную или автоматически выбранную реализацию"""
+    x = np.moveaxis(np.asarray(x), axis, -1)
+    return np.moveaxis(resolve_backend(x.shape[-1], backend)(x), -1, axis)
@@ -0,0 +1,223 @@
+# benchmark.py
+# Статистически корректное сравнение реализаций БПФ:
+# прогрев, повторные замеры perf_counter_ns, медиана, межквартильный размах (IQR)
+# и оценка производительности в GFLOP/s; экспорт в JSON/CSV для сравнения версий.
+
+import argparse
+import csv
+import json
+import math
+import time
+
+import numpy as np
+
+from fft_engine import fft, fft_radix2, rfft
+
+# Размеры по умолчанию: степени двойки и «неудобные» размеры
+DEFAULT_SIZES = [256, 1000, 1024, 4096, 48000, 65536, 1 << 18]
+DEFAULT_DTYPES = ["complex128", "float64"]
+DEFAULT_BATCHES = [1]
+
+# Минимальная длительность одного замера: короткие преобразования
+# повторяются внутри замера, чтобы не измерять разрешение таймера
+MIN_TRIAL_NS = 1_000_000
+
+# Реализации только для вещественного входа: на комплексных типах не замеряются
+REAL_INPUT_ENGINES = {"engine.rfft"}
+
+# Реализации только для одного сигнала (N,): пакеты batch > 1 не замеряются
+SINGLE_SIGNAL_ENGINES = {"fft_recursive"}
+
+RESULT_FIELDS = ["engine", "n", "dtype", "batch", "trials", "number",
+                 "median_ns", "q1_ns", "q3_ns", "iqr_ns", "min_ns", "gflops"]
+
+
+def default_engines():
+    """Реализации для сравнения: имя -> функция БПФ по последней оси"""
+    return {
+        "numpy.fft": np.fft.fft,
+        "engine.fft": fft,
+        "engine.rfft": rfft,
+        "engine.fft_radix2": fft_radix2,
+    }
+
+
+def project_engines():
+    """default_engines() плюс собственные реализации из signal_core: (реализации, limits)"""
+    # Импорт здесь, а не в начале модуля: signal_core -> backends -> benchmark
+    from signal_core import RECURSIVE_MAX_SIZE, fft_iterative, fft_recursive
+
+    engines = default_engines()
+    engines["fft_iterative"] = fft_iterative
+    engines["fft_recursive"] = fft_recursive
+    return engines, {"fft_recursive": RECURSIVE_MAX_SIZE}
+
+
+def fft_flops(n, batch=1):
+    """Оценка числа операций: 5·N·log2(N) на одно преобразование"""
+    return 5.0 * n * math.log2(n) * batch if n > 1 else 0.0
+
+
+def make_input(n, dtype="complex128", batch=1, seed=0):
+    """Случайный входной массив формы (n,) или (batch, n)"""
+    rng = np.random.default_rng(seed)
+    shape = (n,) if batch == 1 else (batch, n)
+    x = rng.standard_normal(shape)
+    if np.issubdtype(np.dtype(dtype), np.complexfloating):
+        x = x + 1j * rng.standard_normal(shape)
+    return x.astype(dtype)
+
+
+def measure(func, x, trials=15, warmup=3, min_trial_ns=MIN_TRIAL_NS):
+    """Времена одного вызова func(x) в наносекундах по trials замерам.
+
+    После прогрева подбирается число вызовов number внутри одного замера,
+    чтобы замер длился не меньше min_trial_ns.
+    """
+    for _ in range(warmup):
+        func(x)
+
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func(x)
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= min_trial_ns:
+            break
+        number *= 2
+
+    samples = []
+    for _ in range(trials):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func(x)
+        samples.append((time.perf_counter_ns() - start) / number)
+    return np.array(samples), number
+
+
+def summarize(samples, n, batch=1):
+    """Медиана, квартили, IQR, минимум и GFLOP/s по медиане"""
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+    return {
+        "median_ns": float(median),
+        "q1_ns": float(q1),
+        "q3_ns": float(q3),
+        "iqr_ns": float(q3 - q1),
+        "min_ns": float(samples.min()),
+        "gflops": fft_flops(n, batch) / median if median > 0 else 0.0,
+    }
+
+
+def run_benchmark(engines=None, sizes=DEFAULT_SIZES, dtypes=DEFAULT_DTYPES,
+                  batches=DEFAULT_BATCHES, trials=15, warmup=3, limits=None,
+                  progress=None):
+    """Прогон всех реализаций по сетке размеров, типов и размеров пакета.
+
+    limits - максимальный размер для отдельных реализаций (например, для
+    медленной рекурсивной); размеры, на которых реализация выдаёт
+    ValueError (степень двойки и т.п.), пропускаются. Реализации из
+    REAL_INPUT_ENGINES на комплексных типах не замеряются: rfft отбросил бы
+    мнимую часть и посчитал другое преобразование. Реализации из
+    SINGLE_SIGNAL_ENGINES замеряются только при batch = 1.
+    progress(done, total) вызывается перед каждым замером.
+    """
+    if engines is None:
+        engines = default_engines()
+    limits = limits or {}
+
+    cases = [(name, n, dtype, batch)
+             for n in sizes for dtype in dtypes for batch in batches
+             for name in engines
+             if n <= limits.get(name, n)
+             and not (name in SINGLE_SIGNAL_ENGINES and batch > 1)
+             and not (name in REAL_INPUT_ENGINES and np.issubdtype(np.dtype(dtype), np.complexfloating))]
+
+    results = []
+    for i, (name, n, dtype, batch) in enumerate(cases):
+        x = make_input(n, dtype, batch)
+        if progress is not None:
+            progress(i + 1, len(cases))
+        try:
+            samples, number = measure(engines[name], x, trials, warmup)
+        except ValueError:
+            continue
+        row = {"engine": name, "n": n, "dtype": dtype, "batch": batch,
+               "trials": trials, "number": number}
+        row.update(summarize(samples, n, batch))
+        results.append(row)
+    return results
+
+
+def save_json(results, path):
+    """Сохранить результаты в JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def load_json(path):
+    """Загрузить результаты, сохранённые save_json"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_csv(results, path):
+    """Сохранить результаты в CSV"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        for row in results:
+            writer.writerow({k: row[k] for k in RESULT_FIELDS})
+
+
+def compare(baseline, results):
+    """Сравнение с эталонным прогоном: отношение медиан new / old по общим случаям"""
+    key = lambda r: (r["engine"], r["n"], r["dtype"], r["batch"])
+    old = {key(r): r for r in baseline}
+    rows = []
+    for r in results:
+        if key(r) in old:
+            ratio = r["median_ns"] / old[key(r)]["median_ns"]
+            rows.append(key(r) + (old[key(r)]["median_ns"], r["median_ns"], ratio))
+    return rows
+
+
+def format_summary(results):
+    """Текстовая таблица результатов"""
+    lines = [f"{'реализация':<20}{'N':>9}{'тип':>12}{'пакет':>7}"
+             f"{'медиана, мс':>13}{'IQR, мс':>10}{'GFLOP/s':>9}"]
+    for r in results:
+        lines.append(f"{r['engine']:<20}{r['n']:>9}{r['dtype']:>12}{r['batch']:>7}"
+                     f"{r['median_ns'] / 1e6:>13.4f}{r['iqr_ns'] / 1e6:>10.4f}{r['gflops']:>9.3f}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк реализаций БПФ")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--dtypes", nargs="+", default=DEFAULT_DTYPES)
+    parser.add_argument("--batches", type=int, nargs="+", default=DEFAULT_BATCHES)
+    parser.add_argument("--trials", type=int, default=15)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--json", help="файл для результатов в JSON")
+    parser.add_argument("--csv", help="файл для результатов в CSV")
+    parser.add_argument("--baseline", help="JSON предыдущего прогона для сравнения")
+    args = parser.parse_args()
+
+    engines, limits = project_engines()
+    results = run_benchmark(engines, sizes=args.sizes, dtypes=args.dtypes, batches=args.batches,
+                            trials=args.trials, warmup=args.warmup, limits=limits)
+    print(format_summary(results))
+
+    if args.json:
+        save_json(results, args.json)
+    if args.csv:
+        save_csv(results, args.csv)
+    if args.baseline:
+        print("\nОтношение медиан к эталону (>1 - медленнее):")
+        for engine, n, dtype, batch, old, new, ratio in compare(load_json(args.baseline), results):
+            print(f"{engine:<20}{n:>9}{dtype:>12}{batch:>7}{ratio:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
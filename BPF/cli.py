@@ -0,0 +1,150 @@
+# cli.py
+# Консольный режим без GUI: расчёт спектров сигналов из файлов и генерация
+# тестовых сигналов. Использует только signal_core (tkinter и matplotlib не нужны).
+#
+#   python main.py spectrum запись.npy -r 48000 -o спектр.npz
+#   python main.py spectrum запись.raw --dtype int16 -r 8000 -o спектр.csv
+#   python main.py generate --frequency 50 -r 1000 --noise 0.1 -o сигнал.npy
+
+import argparse
+import os
+
+import numpy as np
+
+from backends import available_backends
+from filters import FILTER_PRESETS
+from signal_core import (AUTO_BACKEND, DEFAULT_PARAMS, NO_FILTER, REAL_FFT_BACKEND,
+                         generate_signal, signal_spectrum)
+from stft import _to_float, open_signal
+
+
+def read_signal(path, dtype="float32"):
+    """Сигнал из файла: .npy, текст (.txt/.csv, один отсчёт в строке) или «сырые» отсчёты dtype"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        data = np.load(path, mmap_mode="r")
+    elif ext in (".txt", ".csv"):
+        data = np.loadtxt(path, delimiter="," if ext == ".csv" else None, ndmin=1)
+    else:
+        data = open_signal(path, dtype)
+    if data.ndim != 1:
+        raise ValueError(f"Ожидался одномерный сигнал, в файле массив формы {data.shape}")
+    return _to_float(data)
+
+
+def write_spectrum(path, result):
+    """Записать спектры: .npz - все массивы, .csv - частота, амплитуда, фаза"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npz":
+        np.savez(path, **{k: v for k, v in result.items() if k != "signal"})
+    elif ext == ".csv":
+        table = np.column_stack((result["freq_axis"], result["magnitude"], result["phase"]))
+        np.savetxt(path, table, delimiter=",", header="frequency,magnitude,phase", comments="")
+    else:
+        raise ValueError("Формат результата: .npz или .csv")
+
+
+def write_signal(path, signal):
+    """Записать сигнал: .npy, .txt/.csv или «сырые» float32"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        np.save(path, signal)
+    elif ext in (".txt", ".csv"):
+        np.savetxt(path, signal)
+    else:
+        signal.astype(np.float32).tofile(path)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Спектральный анализ сигналов без GUI")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    spectrum = commands.add_parser("spectrum", help="спектры сигналов из файлов")
+    spectrum.add_argument("inputs", nargs="+", help="файлы с сигналом (.npy, .txt, .csv, сырые)")
+    spectrum.add_argument("-r", "--sampling-rate", type=float, required=True, help="частота дискретизации, Гц")
+    spectrum.add_argument("-o", "--output", help="файл результата (.npz/.csv); для нескольких "
+                                                 "входов - каталог, по умолчанию рядом со входом")
+    spectrum.add_argument("--dtype", default="float32", help="тип отсчётов сырых файлов")
+    spectrum.add_argument("--backend", default=REAL_FFT_BACKEND,
+                          choices=[REAL_FFT_BACKEND, AUTO_BACKEND] + available_backends(),
+                          help="реализация БПФ; если она не поддерживает размер сигнала, "
+                               "выбирается автоматически")
+    spectrum.add_argument("--filter", default=NO_FILTER, choices=[NO_FILTER] + list(FILTER_PRESETS))
+
+    generate = commands.add_parser("generate", help="сгенерировать тестовый сигнал")
+    generate.add_argument("-o", "--output", required=True, help="файл сигнала (.npy, .txt, сырые float32)")
+    generate.add_argument("--signal-type", choices=["sin", "cos"], default=DEFAULT_PARAMS["signal_type"])
+    generate.add_argument("--frequency", type=float, default=DEFAULT_PARAMS["frequency"])
+    generate.add_argument("-r", "--sampling-rate", type=int, default=DEFAULT_PARAMS["sampling_rate"])
+    generate.add_argument("--amplitude", type=float, default=DEFAULT_PARAMS["amplitude"])
+    generate.add_argument("--phase", type=float, default=DEFAULT_PARAMS["phase"])
+    generate.add_argument("--noise", type=float, help="уровень шума (СКО); без флага - без шума")
+    generate.add_argument("--seed", type=int, default=DEFAULT_PARAMS["noise_seed"])
+    return parser
+
+
+def _output_path(input_path, output, many):
+    """Путь результата для входного файла"""
+    stem = os.path.splitext(os.path.basename(input_path))[0] + "_spectrum.npz"
+    if output is None:
+        return os.path.join(os.path.dirname(input_path), stem)
+    if many:
+        return os.path.join(output, stem)
+    return output
+
+
+def _output_paths(inputs, output, many):
+    """Пути результатов для всех входов; совпадающие пути - ошибка ValueError.
+
+    Имя результата строится по имени входа без расширения, поэтому
+    day1/signal.raw и day2/signal.raw в общем каталоге или a.npy и a.raw
+    рядом друг с другом дали бы один файл - последний перезаписал бы прежние.
+    """
+    paths = [_output_path(path, output, many) for path in inputs]
+    sources = {}
+    for path, out_path in zip(inputs, paths):
+        sources.setdefault(os.path.abspath(out_path), []).append(path)
+    conflicts = [f"{out_path} <- {', '.join(srcs)}" for out_path, srcs in sources.items() if len(srcs) > 1]
+    if conflicts:
+        raise ValueError("Несколько входов дают один файл результата:\n  " + "\n  ".join(conflicts))
+    return paths
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        params = {
+            "signal_type": args.signal_type,
+            "frequency": args.frequency,
+            "sampling_rate": args.sampling_rate,
+            "amplitude": args.amplitude,
+            "phase": args.phase,
+            "add_noise": args.noise is not None,
+            "noise_level": args.noise or 0.0,
+            "noise_seed": args.seed,
+        }
+        _, signal = generate_signal(params)
+        write_signal(args.output, signal)
+        print(f"{args.output}: {len(signal)} отсчётов")
+        return
+
+    try:
+        out_paths = _output_paths(args.inputs, args.output, len(args.inputs) > 1)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.output is not None and len(args.inputs) > 1:
+        os.makedirs(args.output, exist_ok=True)
+    for path, out_path in zip(args.inputs, out_paths):
+        signal = read_signal(path, args.dtype)
+        result = signal_spectrum(signal, args.sampling_rate, args.backend, args.filter)
+        write_spectrum(out_path, result)
+
+        peak = int(np.argmax(result["magnitude"]))
+        print(f"{path} -> {out_path}: N = {len(signal)}, БПФ {result['fft_time'] * 1000:.3f} мс, "
+              f"пик {result['freq_axis'][peak]:.2f} Гц (амплитуда {result['magnitude'][peak]:.3f})")
+
+
+if __name__ == "__main__":
+    main()
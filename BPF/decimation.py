@@ -0,0 +1,129 @@
+# decimation.py
+# Прорежение данных графиков до ширины осей в пикселях.
+# В каждом столбце пикселей остаются минимум и максимум, поэтому пики спектра
+# не теряются, а число точек на графике не зависит от размера БПФ.
+
+import numpy as np
+
+# Ширина осей (в пикселях), если холст ещё не отрисован
+DEFAULT_PIXELS = 800
+
+
+def minmax_decimate(x, y, pixels, x_range=None):
+    """Прорежение (x, y) до ~2·pixels точек: минимум и максимум каждого столбца.
+
+    x - возрастающий массив. Если задан x_range = (x0, x1), берётся только
+    видимый участок (плюс по точке за его краями, чтобы линия доходила до края).
+    Точки минимума и максимума выдаются в исходном порядке и с точными x.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x_range is not None:
+        lo = max(np.searchsorted(x, x_range[0], side="left") - 1, 0)
+        hi = np.searchsorted(x, x_range[1], side="right") + 1
+        x, y = x[lo:hi], y[lo:hi]
+
+    n = len(x)
+    pixels = max(int(pixels), 1)
+    if n <= 2 * pixels:
+        return x, y
+
+    # Столбцы равной длины; последний дополняется повтором последнего отсчёта
+    size = -(-n // pixels)
+    columns = -(-n // size)
+    padded = np.empty(columns * size, dtype=y.dtype)
+    padded[:n] = y
+    padded[n:] = y[-1]
+    table = padded.reshape(columns, size)
+
+    offsets = np.arange(columns) * size
+    i_min = np.minimum(offsets + np.argmin(table, axis=1), n - 1)
+    i_max = np.minimum(offsets + np.argmax(table, axis=1), n - 1)
+    idx = np.column_stack((np.minimum(i_min, i_max), np.maximum(i_min, i_max))).ravel()
+    return x[idx], y[idx]
+
+
+def column_peaks(x, y, pixels, x_range=None):
+    """Прорежение до pixels точек: только максимум каждого столбца (для стеблей)"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x_range is not None:
+        lo = np.searchsorted(x, x_range[0], side="left")
+        hi = np.searchsorted(x, x_range[1], side="right")
+        x, y = x[lo:hi], y[lo:hi]
+
+    n = len(x)
+    pixels = max(int(pixels), 1)
+    if n <= pixels:
+        return x, y
+
+    size = -(-n // pixels)
+    columns = -(-n // size)
+    padded = np.full(columns * size, -np.inf)
+    padded[:n] = y
+    idx = np.arange(columns) * size + np.argmax(padded.reshape(columns, size), axis=1)
+    return x[idx], y[idx]
+
+
+def stem_path(x, y, baseline=0.0):
+    """Вершины одной линии, рисующей стебли (x, baseline)-(x, y), разделённые NaN"""
+    count = len(x)
+    px = np.empty(3 * count)
+    py = np.empty(3 * count)
+    px[0::3] = x
+    px[1::3] = x
+    px[2::3] = np.nan
+    py[0::3] = baseline
+    py[1::3] = y
+    py[2::3] = np.nan
+    return px, py
+
+
+class DecimatedLine:
+    """Линия matplotlib, показывающая прореженную копию полных данных.
+
+    Полные массивы хранятся в объекте; при изменении пределов оси X
+    (масштабирование, сдвиг) и размера холста прорежение пересчитывается
+    только для видимого участка, поэтому время отрисовки не зависит от N.
+    stem=True рисует стебли (как ax.stem) одной линией: в каждом столбце
+    пикселей - стебель до максимума; markers - необязательная линия маркеров
+    на вершинах стеблей.
+    """
+
+    def __init__(self, line, stem=False, markers=None, baseline=0.0):
+        self.line = line
+        self.ax = line.axes
+        self.stem = stem
+        self.markers = markers
+        self.baseline = baseline
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.ax.callbacks.connect("xlim_changed", lambda ax: self.refresh())
+        if self.ax.figure.canvas is not None:
+            self.ax.figure.canvas.mpl_connect("resize_event", lambda event: self.refresh())
+
+    def __repr__(self):
+        return f"DecimatedLine(points={len(self.x)}, stem={self.stem})"
+
+    def pixels(self):
+        """Ширина осей в пикселях"""
+        width = self.ax.bbox.width
+        return int(width) if width > 1 else DEFAULT_PIXELS
+
+    def set_data(self, x, y):
+        """Задать полные данные и показать их прореженную копию"""
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.refresh()
+
+    def refresh(self):
+        """Пересчитать прорежение для текущего видимого участка"""
+        # При автомасштабировании X пределы задают сами данные - берём их целиком
+        x_range = None if self.ax.get_autoscalex_on() else self.ax.get_xlim()
+        if self.stem:
+            x, y = column_peaks(self.x, self.y, self.pixels(), x_range)
+            self.line.set_data(*stem_path(x, y, self.baseline))
+            if self.markers is not None:
+                self.markers.set_data(x, y)
+        else:
+            self.line.set_data(*minmax_decimate(self.x, self.y, self.pixels(), x_range))
@@ -0,0 +1,504 @@
+# fft_engine.py
+# Векторизованное БПФ по основанию 2 (Кули-Тьюки).
+# Каждый этап бабочек выполняется целиком операциями NumPy над срезами массива,
+# без поэлементных циклов Python.
+# Поворотные множители и перестановка хранятся в планах (LRU-кэш); «гладкие»
+# размеры 2^a·3^b·5^c считаются смешанным основанием, остальные - Блюстейном.
+# Все функции принимают массивы (..., N) и пакет каналов считают одним проходом;
+# с out= повторные преобразования не создают новых массивов.
+
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+# Сколько планов (размер, тип) держать в кэше одновременно
+PLAN_CACHE_SIZE = 32
+
+# Основания, кроме 2, для которых есть ядро смешанного основания
+SMOOTH_RADICES = (3, 5)
+
+# Число комплексных отсчётов в одном блоке пакетного БПФ (~1 МБ для complex128)
+BATCH_BLOCK_SIZE = 1 << 16
+
+# До этого размера план хранит поворотные множители всех этапов (N/2·log2 N
+# чисел) и считает этапами постоянной геометрии без временных массивов
+CONSTANT_GEOMETRY_MAX_SIZE = 1 << 16
+
+
+def is_power_of_two(n):
+    """Проверка, что n - степень двойки"""
+    return n > 0 and n & (n - 1) == 0
+
+
+def bit_reverse_indices(N):
+    """Индексы бит-реверсивной перестановки для размера N"""
+    # rev(2n) = [2·rev(n), 2·rev(n) + 1] - удвоение за O(N) в сумме
+    rev = np.zeros(1, dtype=np.intp)
+    while len(rev) < N:
+        rev = np.concatenate((2 * rev, 2 * rev + 1))
+    return rev
+
+
+def twiddle_factors(N):
+    """Поворотные множители W_N^k = exp(-2πi·k/N) для k = 0..N/2-1"""
+    return np.exp(-2j * np.pi * np.arange(N // 2) / N)
+
+
+def radix2_butterflies(x, twiddles=None, buf=None):
+    """Все этапы бабочек над массивом в бит-реверсивном порядке (на месте).
+
+    Преобразование идёт по последней оси (массив в C-порядке); ведущие оси
+    обрабатываются вместе с ней одной операцией. На этапе с половиной
+    блока h массив рассматривается как (N/2h, 2, h): верхние и нижние
+    половины всех блоков обрабатываются одной операцией, а множители
+    W_2h^j берутся из общей таблицы W_N с шагом N/2h.
+    buf - рабочий буфер формы (..., N/2); если не задан, создаётся.
+    """
+    N = x.shape[-1]
+    if twiddles is None:
+        twiddles = twiddle_factors(N)
+    lead = x.shape[:-1]
+    if buf is None:
+        buf = np.empty(lead + (N // 2,), dtype=x.dtype)
+
+    # Пакет строк обрабатывается блоками, помещающимися в кэш процессора:
+    # иначе каждый этап заново прогоняет весь пакет через память
+    rows = x.size // N if N else 0
+    block_rows = max(1, BATCH_BLOCK_SIZE // N)
+    if rows > block_rows:
+        flat = x.reshape(rows, N)
+        flat_buf = buf.reshape(rows, N // 2)
+        for start in range(0, rows, block_rows):
+            stop = start + block_rows
+            radix2_butterflies(flat[start:stop], twiddles, flat_buf[start:stop])
+        return x
+
+    h = 1
+    while h < N:
+        blocks = x.reshape(lead + (-1, 2, h))
+        even = blocks[..., 0, :]
+        odd = blocks[..., 1, :]
+        t = buf.reshape(lead + (-1, h))
+        if h == 1:
+            # W_2^0 = 1 - умножение не нужно
+            t[...] = odd
+        else:
+            np.multiply(odd, twiddles[::N // (2 * h)], out=t)
+        np.subtract(even, t, out=odd)
+        np.add(even, t, out=even)
+        h *= 2
+
+    return x
+
+
+def stage_twiddle_table(N, twiddles=None):
+    """Множители этапов постоянной геометрии: строка s - W_N^((k >> s) << s), k < N/2.
+
+    Последний этап (все множители равны 1) в таблицу не входит.
+    """
+    if twiddles is None:
+        twiddles = twiddle_factors(N)
+    k = np.arange(N // 2)
+    stages = max(N.bit_length() - 2, 0)
+    return np.array([twiddles[(k >> s) << s] for s in range(stages)], dtype=twiddles.dtype).reshape(stages, N // 2)
+
+
+def constant_geometry_stages(a, b, stage_twiddles):
+    """Этапы БПФ с прореживанием по частоте в форме Пиза (постоянная геометрия).
+
+    Вход - a в естественном порядке, результат - в бит-реверсивном порядке
+    в a или b (возвращается тот, где он оказался). Каждый этап читает
+    половины src[:N/2] и src[N/2:] и пишет в чётные и нечётные отсчёты
+    другого буфера: выходы никогда не пересекаются со входами, а для
+    одного сигнала все операнды одномерные - NumPy не создаёт временных
+    буферов, и преобразование не выделяет память.
+    """
+    N = a.shape[-1]
+    half = N // 2
+    src, dst = a, b
+    for s in range(N.bit_length() - 1):
+        lo = src[..., :half]
+        hi = src[..., half:]
+        even = dst[..., 0::2]
+        odd = dst[..., 1::2]
+        np.add(lo, hi, out=even)
+        np.subtract(lo, hi, out=odd)
+        if s < len(stage_twiddles):
+            np.multiply(odd, stage_twiddles[s], out=odd)
+        src, dst = dst, src
+    return src
+
+
+class FFTPlan:
+    """План БПФ размера N: поворотные множители и бит-реверсивная перестановка.
+
+    Таблицы вычисляются один раз при создании плана и используются
+    и для прямого, и для обратного преобразования. Рабочие буферы
+    перестановки и бабочек хранятся в плане (отдельно для каждого потока)
+    и переиспользуются, поэтому с заданным out преобразование не создаёт
+    новых массивов. До CONSTANT_GEOMETRY_MAX_SIZE используются этапы
+    постоянной геометрии (constant_geometry_stages): для одного сигнала
+    это и без временных буферов NumPy внутри операций.
+    """
+
+    def __init__(self, N, dtype=np.complex128):
+        if not is_power_of_two(N):
+            raise ValueError("Размер должен быть степенью 2")
+
+        self.N = N
+        self.dtype = np.dtype(dtype)
+        self.bit_reverse = bit_reverse_indices(N)
+        self.twiddles = twiddle_factors(N).astype(self.dtype)
+        self.stage_twiddles = (stage_twiddle_table(N, self.twiddles)
+                               if N <= CONSTANT_GEOMETRY_MAX_SIZE else None)
+        self._local = threading.local()
+
+    def __repr__(self):
+        return f"FFTPlan(N={self.N}, dtype={self.dtype})"
+
+    def _check_size(self, x):
+        if x.shape[-1] != self.N:
+            raise ValueError(f"План рассчитан на {self.N} точек, получено {x.shape[-1]}")
+
+    def _buffer(self, name, shape):
+        """Рабочий буфер name текущего потока формы shape (создаётся один раз)"""
+        buffers = self._local.__dict__.setdefault("buffers", {})
+        buf = buffers.get(name)
+        if buf is None or buf.shape != shape:
+            # Храним буфер только для последней формы - память не растёт
+            buf = buffers[name] = np.empty(shape, dtype=self.dtype)
+        return buf
+
+    def _prepare_output(self, x, out, overwrite_input):
+        """Массив, в котором будет выполнено преобразование"""
+        if out is None and overwrite_input and x.dtype == self.dtype and x.flags.c_contiguous:
+            return x
+        if out is None:
+            return np.empty(x.shape, dtype=self.dtype)
+        if out.shape != x.shape or out.dtype != self.dtype or not out.flags.c_contiguous:
+            raise ValueError(f"out должен быть C-массивом формы {x.shape} и типа {self.dtype}")
+        return out
+
+    def _transform(self, x, out, overwrite_input, inverse):
+        x = np.asarray(x)
+        self._check_size(x)
+        result = self._prepare_output(x, out, overwrite_input)
+
+        if self.stage_twiddles is not None:
+            # Вход копируется в буфер плана, этапы идут между двумя буферами,
+            # бит-реверсивная перестановка результата - сразу в result
+            a = self._buffer("perm", result.shape)
+            np.copyto(a, x, casting="same_kind")
+            if inverse:
+                np.conjugate(a, out=a)
+            spectrum = constant_geometry_stages(a, self._buffer("butterfly", result.shape),
+                                                self.stage_twiddles)
+            np.take(spectrum, self.bit_reverse, axis=-1, out=result, mode="clip")
+            if inverse:
+                np.conjugate(result, out=result)
+                result /= self.N
+            return result
+
+        # Перестановка сразу в result; take с mode="clip" не создаёт
+        # промежуточных массивов. Если вход другого типа или совпадает
+        # с result, он сначала копируется в рабочий буфер плана.
+        if x.dtype == self.dtype and not np.may_share_memory(x, result):
+            np.take(x, self.bit_reverse, axis=-1, out=result, mode="clip")
+        else:
+            perm = self._buffer("perm", result.shape)
+            np.copyto(perm, x, casting="same_kind")
+            np.take(perm, self.bit_reverse, axis=-1, out=result, mode="clip")
+        if inverse:
+            np.conjugate(result, out=result)
+
+        buf = self._buffer("butterfly", result.shape[:-1] + (self.N // 2,))
+        radix2_butterflies(result, self.twiddles, buf)
+        if inverse:
+            # IFFT(X) = conj(FFT(conj(X))) / N
+            np.conjugate(result, out=result)
+            result /= self.N
+        return result
+
+    def forward(self, x, out=None, overwrite_input=False):
+        """Прямое БПФ по последней оси.
+
+        out - готовый C-массив для результата; overwrite_input=True
+        разрешает записать результат прямо во вход подходящего типа.
+        """
+        return self._transform(x, out, overwrite_input, inverse=False)
+
+    def inverse(self, X, out=None, overwrite_input=False):
+        """Обратное БПФ по последней оси: IFFT(X) = conj(FFT(conj(X))) / N"""
+        return self._transform(X, out, overwrite_input, inverse=True)
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _cached_plan(N, dtype_str):
+    return FFTPlan(N, np.dtype(dtype_str))
+
+
+def get_plan(N, dtype=np.complex128):
+    """План из LRU-кэша; создаётся при первом обращении к (N, dtype)"""
+    return _cached_plan(N, np.dtype(dtype).str)
+
+
+def _small_prime_factor(N):
+    """Наименьший множитель N из SMOOTH_RADICES или None"""
+    for p in SMOOTH_RADICES:
+        if N % p == 0:
+            return p
+    return None
+
+
+def is_smooth(N):
+    """N раскладывается только на множители 2, 3 и 5"""
+    if N < 1:
+        return False
+    for p in (2,) + SMOOTH_RADICES:
+        while N % p == 0:
+            N //= p
+    return N == 1
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _mixed_radix_tables(N, p):
+    """Матрица ДПФ размера p и поворотные множители W_N^(n1·k1) формы (p, N/p)"""
+    m = N // p
+    n = np.arange(p)
+    dft_matrix = np.exp(-2j * np.pi * np.outer(n, n) / p)
+    twiddles = np.exp(-2j * np.pi * np.outer(n, np.arange(m)) / N)
+    return dft_matrix, twiddles
+
+
+def _fft_smooth(x):
+    """Смешанное основание 2/3/5 (прореживание по времени) по последней оси.
+
+    N = p·m: x[n1 + p·n2] раскладывается на p подпоследовательностей длины m,
+    все они преобразуются одним пакетным вызовом, затем умножаются на
+    W_N^(n1·k1) и объединяются ДПФ размера p:
+    X[k1 + m·k2] = Σ_n1 W_p^(n1·k2) · W_N^(n1·k1) · Y_n1[k1].
+    Степень двойки, оставшаяся после отделения множителей 3 и 5,
+    считается векторизованным ядром по основанию 2.
+    """
+    N = x.shape[-1]
+    p = _small_prime_factor(N)
+    if p is None:
+        return get_plan(N).forward(x)
+
+    m = N // p
+    lead = x.shape[:-1]
+    # (..., m, p) -> (..., p, m): строка n1 содержит x[n1], x[n1 + p], ...
+    sub = x.reshape(lead + (m, p)).swapaxes(-1, -2)
+    Y = _fft_smooth(np.ascontiguousarray(sub))
+
+    dft_matrix, twiddles = _mixed_radix_tables(N, p)
+    Y *= twiddles
+    return np.matmul(dft_matrix, Y).reshape(lead + (N,))
+
+
+class BluesteinPlan:
+    """БПФ произвольного размера N через chirp-z преобразование Блюстейна.
+
+    n·k = (n² + k² - (k - n)²) / 2, поэтому ДПФ сводится к циклической свёртке
+    с чирпом exp(iπn²/N) длины M ≥ 2N - 1, M - степень двойки. Свёртка
+    считается ядром по основанию 2; спектр чирпа вычисляется один раз.
+    """
+
+    def __init__(self, N):
+        self.N = N
+        self.M = 1 << (2 * N - 2).bit_length()
+        self.plan = get_plan(self.M)
+
+        # n² берётся по модулю 2N, чтобы не терять точность для больших n
+        n = np.arange(N)
+        self.chirp = np.exp(-1j * np.pi * ((n * n) % (2 * N)) / N)
+
+        b = np.zeros(self.M, dtype=complex)
+        b[:N] = np.conj(self.chirp)
+        b[self.M - N + 1:] = np.conj(self.chirp[1:][::-1])
+        self.chirp_spectrum = self.plan.forward(b)
+
+    def __repr__(self):
+        return f"BluesteinPlan(N={self.N}, M={self.M})"
+
+    def forward(self, x):
+        """Прямое БПФ по последней оси"""
+        x = np.asarray(x)
+        lead = x.shape[:-1]
+        a = np.zeros(lead + (self.M,), dtype=complex)
+        a[..., :self.N] = x * self.chirp
+        conv = self.plan.inverse(self.plan.forward(a) * self.chirp_spectrum)
+        return conv[..., :self.N] * self.chirp
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def get_bluestein_plan(N):
+    """План Блюстейна из LRU-кэша"""
+    return BluesteinPlan(N)
+
+
+def _fft_last(x):
+    """БПФ произвольного размера по последней оси.
+
+    Степени двойки - ядро по основанию 2, размеры вида 2^a·3^b·5^c -
+    смешанное основание, остальные (в т.ч. простые) - алгоритм Блюстейна.
+    """
+    N = x.shape[-1]
+    if N < 1:
+        raise ValueError("Размер должен быть положительным")
+    if is_power_of_two(N):
+        return get_plan(N).forward(x)
+    if is_smooth(N):
+        return _fft_smooth(x.astype(complex))
+    return get_bluestein_plan(N).forward(x)
+
+
+def _along_axis(func, x, axis, *args):
+    """Применить func к последней оси, предварительно переставив на неё axis"""
+    x = np.moveaxis(np.asarray(x), axis, -1)
+    return np.moveaxis(func(x, *args), -1, axis)
+
+
+def _result_dtype(x, dtype):
+    """Тип результата: заданный явно или complex64 для входов одинарной точности"""
+    if dtype is None:
+        single = x.dtype in (np.float16, np.float32, np.complex64)
+        return np.dtype(np.complex64 if single else np.complex128)
+
+    dtype = np.dtype(dtype)
+    if dtype not in (np.complex64, np.complex128):
+        raise ValueError("dtype должен быть complex64 или complex128")
+    return dtype
+
+
+def _transform(x, axis, out, overwrite_input, dtype, inverse):
+    x = np.asarray(x)
+    dtype = _result_dtype(x, dtype)
+    N = x.shape[axis]
+
+    # Степень двойки по последней оси - перестановка и бабочки прямо в out
+    if is_power_of_two(N) and axis in (-1, x.ndim - 1):
+        plan = get_plan(N, dtype)
+        transform = plan.inverse if inverse else plan.forward
+        return transform(x, out=out, overwrite_input=overwrite_input)
+
+    if inverse:
+        result = np.conj(_along_axis(_fft_last, np.conj(x), axis))
+        result /= N
+    else:
+        result = _along_axis(_fft_last, x, axis)
+
+    if out is None:
+        return result.astype(dtype, copy=False)
+    out[...] = result
+    return out
+
+
+def fft(x, axis=-1, out=None, overwrite_input=False, dtype=None):
+    """БПФ произвольного размера вдоль оси axis.
+
+    Массив формы (..., N) преобразуется за один векторизованный проход:
+    все строки (каналы) обрабатываются вместе с общим планом.
+    Для степеней двойки по последней оси перестановка и бабочки
+    выполняются прямо в out (или во входе при overwrite_input=True) с
+    рабочими буферами плана - повторные вызовы не создают новых массивов.
+    dtype=complex64 вдвое снижает объём данных, если точность допускает.
+    """
+    return _transform(x, axis, out, overwrite_input, dtype, inverse=False)
+
+
+def ifft(X, axis=-1, out=None, overwrite_input=False, dtype=None):
+    """Обратное БПФ произвольного размера: IFFT(X) = conj(FFT(conj(X))) / N"""
+    return _transform(X, axis, out, overwrite_input, dtype, inverse=True)
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _rfft_twiddles(N):
+    """W_N^k для k = 0..N/2 - разделение спектров чётных и нечётных отсчётов"""
+    return np.exp(-2j * np.pi * np.arange(N // 2 + 1) / N)
+
+
+def _rfft_last(x):
+    """БПФ вещественного сигнала: только N/2+1 неизбыточных отсчётов.
+
+    Для чётного N пары отсчётов упаковываются в комплексный сигнал
+    z[n] = x[2n] + i·x[2n+1] длины N/2, и после одного БПФ половинного
+    размера спектр восстанавливается по эрмитовой симметрии:
+    X[k] = E[k] + W_N^k·O[k], E[k] = (Z[k] + Z*[N/2-k]) / 2,
+    O[k] = (Z[k] - Z*[N/2-k]) / 2i.
+    """
+    x = x.astype(float, copy=False)
+    N = x.shape[-1]
+    if N % 2:
+        return _fft_last(x)[..., :N // 2 + 1]
+
+    half = N // 2
+    Z = _fft_last(x[..., 0::2] + 1j * x[..., 1::2])
+    # Z[N/2] = Z[0] по периодичности
+    Z = np.concatenate((Z, Z[..., :1]), axis=-1)
+    Z_rev = np.conj(Z[..., ::-1])
+
+    E = (Z + Z_rev) * 0.5
+    O = (Z - Z_rev) * -0.5j
+    O *= _rfft_twiddles(N)
+    E += O
+    return E[..., :half + 1]
+
+
+def _irfft_last(X, n=None):
+    """Обратное к rfft: N/2+1 отсчётов спектра -> вещественный сигнал длины n.
+
+    По умолчанию n = 2·(len(X) - 1). Для чётного n спектры чётных и нечётных
+    отсчётов E[k] = (X[k] + X*[N/2-k]) / 2, O[k] = (X[k] - X*[N/2-k]) / 2 · W_N^-k
+    собираются в Z = E + i·O, и одно обратное БПФ размера N/2 даёт x[2n] + i·x[2n+1].
+    """
+    N = 2 * (X.shape[-1] - 1) if n is None else n
+    if N < 1:
+        raise ValueError("Размер должен быть положительным")
+
+    bins = N // 2 + 1
+    if X.shape[-1] < bins:
+        pad = [(0, 0)] * (X.ndim - 1) + [(0, bins - X.shape[-1])]
+        X = np.pad(X, pad)
+    X = X[..., :bins]
+
+    if N % 2:
+        # Полный спектр по эрмитовой симметрии
+        full = np.concatenate((X, np.conj(X[..., 1:][..., ::-1])), axis=-1)
+        return ifft(full).real
+
+    half = N // 2
+    X_rev = np.conj(X[..., ::-1])
+    E = (X + X_rev)[..., :half] * 0.5
+    O = (X - X_rev)[..., :half] * 0.5
+    O *= np.conj(_rfft_twiddles(N)[:half])
+    E += 1j * O
+    z = ifft(E)
+
+    x = np.empty(X.shape[:-1] + (N,))
+    x[..., 0::2] = z.real
+    x[..., 1::2] = z.imag
+    return x
+
+
+def rfft(x, axis=-1):
+    """БПФ вещественного сигнала вдоль оси axis (N/2+1 отсчётов)"""
+    return _along_axis(_rfft_last, x, axis)
+
+
+def irfft(X, n=None, axis=-1):
+    """Обратное к rfft вдоль оси axis"""
+    return _along_axis(_irfft_last, X, axis, n)
+
+
+def fft_radix2(x, axis=-1):
+    """Векторизованное итеративное БПФ, N - степень двойки"""
+    x = np.asarray(x)
+    return _along_axis(get_plan(x.shape[axis]).forward, x, axis)
+
+
+def ifft_radix2(X, axis=-1):
+    """Обратное векторизованное БПФ, N - степень двойки"""
+    X = np.asarray(X)
+    return _along_axis(get_plan(X.shape[axis]).inverse, X, axis)
@@ -0,0 +1,542 @@
+# gui.py
+# Графический интерфейс (tkinter + matplotlib). Вычисления - в signal_core.py;
+# модуль загружается из main.py только при запуске GUI.
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import threading
+
+from backends import CALIBRATION_FILE, available_backends, calibrate, crossover_points
+from benchmark import format_summary, measure, project_engines, run_benchmark, summarize
+from decimation import DecimatedLine
+from filters import FILTER_PRESETS
+from instrumentation import StageTimer, format_stages
+from signal_core import (AUTO_BACKEND, NO_FILTER, REAL_FFT_BACKEND,
+                         calculate_spectrum, fft_iterative, generate_signal)
+from spectrum_cache import SpectrumCache
+from spectrum_worker import RESULT_POLL_MS, SpectrumWorker
+
+# Минимальный интервал между перерисовками при перетаскивании ползунков (~60 кадров/с)
+FRAME_INTERVAL_MS = 16
+
+# Этапы конвейера обновления в порядке выполнения (для таблицы задержек)
+PIPELINE_STAGES = ["generate_signal", "filter", "fft", "spectrum", "update_artists",
+                   "tight_layout", "draw"]
+
+# Размеры для бенчмарка, запускаемого из GUI
+GUI_BENCHMARK_SIZES = [256, 1000, 1024, 4096, 48000, 65536]
+
+
+class FFTApplication:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Быстрое преобразование Фурье (БПФ)")
+
+        # Переменные для параметров
+        self.signal_type = tk.StringVar(value="sin")
+        self.frequency = tk.DoubleVar(value=5.0)
+        self.sampling_rate = tk.IntVar(value=256)
+        self.amplitude = tk.DoubleVar(value=1.0)
+        self.phase = tk.DoubleVar(value=0.0)
+        self.add_noise = tk.BooleanVar(value=False)
+        self.noise_level = tk.DoubleVar(value=0.1)
+        self.fft_backend = tk.StringVar(value=REAL_FFT_BACKEND)
+        self.filter_preset = tk.StringVar(value=NO_FILTER)
+
+        # Зерно генератора шума: одна реализация шума, пока не нажата «Обновить»
+        self.noise_seed = 0
+
+        # Скользящие перцентили длительности этапов конвейера
+        self.timer = StageTimer()
+
+        # Готовые спектры по параметрам сигнала (LRU, ограничен по размеру в байтах)
+        self.spectrum_cache = SpectrumCache()
+
+        # Идентификатор отложенного обновления (root.after), если оно запланировано
+        self._pending_update = None
+
+        # Сигнал и БПФ считаются в фоновом потоке; результаты забирает из очереди
+        # опрос в потоке GUI (poll_worker)
+        self.worker = SpectrumWorker(self.compute_spectrum, self.draw_spectrum,
+                                     self.show_compute_error)
+        self.root.after(RESULT_POLL_MS, self.poll_worker)
+
+        self.setup_ui()
+        self.update_plots()
+
+    def setup_ui(self):
+        # Главный контейнер
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True) # Используем pack для простоты
+
+        # --- НАЧАЛО ИЗМЕНЕНИЙ: Создание прокручиваемой области ---
+
+        # 1. Создаем холст (Canvas)
+        canvas = tk.Canvas(main_frame)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # 2. Создаем полосу прокрутки (Scrollbar)
+        scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # 3. Связываем их
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # 4. Создаем фрейм ВНУТРИ холста, в который будем помещать все виджеты
+        self.scrollable_frame = ttk.Frame(canvas)
+
+        # 5. Добавляем этот фрейм на холст
+        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+
+        # 6. Магия: говорим холсту обновлять свою область прокрутки, когда размер фрейма меняется
+        self.scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(
+                scrollregion=canvas.bbox("all")
+            )
+        )
+        # --- КОНЕЦ ИЗМЕНЕНИЙ ---
+
+
+        # --- ВАЖНО: Теперь все виджеты добавляем в self.scrollable_frame, а не в main_frame ---
+
+        # Панель управления
+        control_frame = ttk.LabelFrame(self.scrollable_frame, text="Параметры сигнала", padding="10")
+        control_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=10)
+
+        # Тип сигнала
+        ttk.Label(control_frame, text="Тип сигнала:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        signal_frame = ttk.Frame(control_frame)
+        signal_frame.grid(row=0, column=1, sticky=tk.W, padx=5)
+        ttk.Radiobutton(signal_frame, text="sin(x)", variable=self.signal_type,
+                        value="sin", command=self.update_plots).pack(side=tk.LEFT)
+        ttk.Radiobutton(signal_frame, text="cos(x)", variable=self.signal_type,
+                        value="cos", command=self.update_plots).pack(side=tk.LEFT, padx=10)
+
+        # Частота
+        ttk.Label(control_frame, text="Частота (Гц):").grid(row=0, column=2, sticky=tk.W, padx=5)
+        freq_spinbox = ttk.Spinbox(control_frame, from_=0.5, to=50, textvariable=self.frequency,
+                                   width=10, increment=0.5, command=self.schedule_update)
+        freq_spinbox.grid(row=0, column=3, padx=5)
+
+        # Частота дискретизации
+        ttk.Label(control_frame, text="Частота дискретизации:").grid(row=0, column=4, sticky=tk.W, padx=5)
+        sampling_combo = ttk.Combobox(control_frame, textvariable=self.sampling_rate,
+                                      values=[64, 100, 128, 256, 500, 512, 1000, 1024, 2048, 4410, 4800],
+                                      width=8)
+        sampling_combo.grid(row=0, column=5, padx=5)
+        sampling_combo.bind('<<ComboboxSelected>>', lambda e: self.update_plots())
+        # Произвольный размер можно ввести вручную
+        sampling_combo.bind('<Return>', lambda e: self.update_plots())
+
+        # Амплитуда
+        ttk.Label(control_frame, text="Амплитуда:").grid(row=1, column=0, sticky=tk.W, padx=5)
+        ttk.Scale(control_frame, from_=0.1, to=2.0, variable=self.amplitude,
+                  orient=tk.HORIZONTAL, length=100, command=lambda x: self.schedule_update()).grid(row=1, column=1, padx=5)
+        ttk.Label(control_frame, textvariable=self.amplitude).grid(row=1, column=2, sticky=tk.W)
+
+        # Фаза
+        ttk.Label(control_frame, text="Фаза (рад):").grid(row=1, column=3, sticky=tk.W, padx=5)
+        ttk.Scale(control_frame, from_=0, to=2 * np.pi, variable=self.phase,
+                  orient=tk.HORIZONTAL, length=100, command=lambda x: self.schedule_update()).grid(row=1, column=4, padx=5)
+
+        # Шум
+        noise_frame = ttk.Frame(control_frame)
+        noise_frame.grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=5)
+        ttk.Checkbutton(noise_frame, text="Добавить шум", variable=self.add_noise,
+                        command=self.update_plots).pack(side=tk.LEFT, padx=5)
+        ttk.Label(noise_frame, text="Уровень шума:").pack(side=tk.LEFT, padx=5)
+        ttk.Scale(noise_frame, from_=0.01, to=0.5, variable=self.noise_level,
+                  orient=tk.HORIZONTAL, length=100, command=lambda x: self.schedule_update()).pack(side=tk.LEFT)
+
+        # Реализация БПФ
+        backend_frame = ttk.Frame(control_frame)
+        backend_frame.grid(row=3, column=0, columnspan=6, sticky=tk.W, pady=5)
+        ttk.Label(backend_frame, text="Реализация БПФ:").pack(side=tk.LEFT, padx=5)
+        backend_combo = ttk.Combobox(backend_frame, textvariable=self.fft_backend, state="readonly",
+                                     values=[REAL_FFT_BACKEND, AUTO_BACKEND] + available_backends(),
+                                     width=12)
+        backend_combo.pack(side=tk.LEFT, padx=5)
+        backend_combo.bind('<<ComboboxSelected>>', lambda e: self.update_plots())
+        ttk.Button(backend_frame, text="Калибровка", command=self.start_calibration).pack(side=tk.LEFT,
+                                                                                            padx=5)
+        ttk.Label(backend_frame, text="Фильтр:").pack(side=tk.LEFT, padx=5)
+        filter_combo = ttk.Combobox(backend_frame, textvariable=self.filter_preset, state="readonly",
+                                    values=[NO_FILTER] + list(FILTER_PRESETS), width=10)
+        filter_combo.pack(side=tk.LEFT, padx=5)
+        filter_combo.bind('<<ComboboxSelected>>', lambda e: self.update_plots())
+
+        # Кнопки
+        button_frame = ttk.Frame(control_frame)
+        button_frame.grid(row=2, column=3, columnspan=3, pady=5)
+        ttk.Button(button_frame, text="Обновить", command=self.new_noise).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Сравнить с NumPy FFT", command=self.compare_with_numpy).pack(side=tk.LEFT,
+                                                                                                    padx=5)
+        ttk.Button(button_frame, text="Бенчмарк", command=self.start_benchmark).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Показать алгоритм", command=self.show_algorithm).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Экспорт профиля", command=self.export_profile).pack(side=tk.LEFT, padx=5)
+
+        # Информационная панель
+        info_frame = ttk.LabelFrame(self.scrollable_frame, text="Информация", padding="10")
+        info_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=10)
+
+        self.info_text = tk.Text(info_frame, height=5, width=80)
+        self.info_text.pack(fill=tk.BOTH, expand=True)
+
+        # Задержки этапов: p50/p95/p99 по последним обновлениям (мс)
+        self.stage_text = tk.Text(info_frame, height=len(PIPELINE_STAGES) + 1, width=80)
+        self.stage_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+        # Создание области для графиков
+        self.figure = plt.Figure(figsize=(12, 8), dpi=80)
+        self.canvas_matplotlib = FigureCanvasTkAgg(self.figure, self.scrollable_frame) # ИЗМЕНЕНО: родитель - self.scrollable_frame
+        self.canvas_matplotlib.get_tk_widget().grid(row=2, column=0, columnspan=2, pady=10, padx=10)
+        # draw_idle вызывает draw в простое цикла событий - замеряется сама отрисовка
+        self.canvas_matplotlib.draw = self.timer.wrap("draw", self.canvas_matplotlib.draw)
+        # Масштабирование и сдвиг графиков; прорежение пересчитывается по видимому участку
+        toolbar = NavigationToolbar2Tk(self.canvas_matplotlib, self.scrollable_frame, pack_toolbar=False)
+        toolbar.grid(row=3, column=0, columnspan=2, sticky=tk.W, padx=10)
+        self.setup_plots()
+
+    def setup_plots(self):
+        """Создание подграфиков и графических объектов (один раз при запуске)"""
+        self.ax_signal = self.figure.add_subplot(2, 2, 1)
+        self.ax_magnitude = self.figure.add_subplot(2, 2, 2)
+        self.ax_phase = self.figure.add_subplot(2, 2, 3)
+        self.ax_psd = self.figure.add_subplot(2, 2, 4)
+
+        # График исходного сигнала
+        self.signal_line, = self.ax_signal.plot([], [], 'b-', linewidth=1.5)
+        self.signal_view = DecimatedLine(self.signal_line)
+        self.ax_signal.set_title('Исходный сигнал')
+        self.ax_signal.set_xlabel('Время (с)')
+        self.ax_signal.set_ylabel('Амплитуда')
+        self.ax_signal.grid(True, alpha=0.3)
+
+        # Амплитудный спектр
+        # Стебли всех отсчётов - одна линия, прореженная до ширины осей в пикселях
+        self.magnitude_line, = self.ax_magnitude.plot([], [], 'C0-', linewidth=1)
+        self.magnitude_markers, = self.ax_magnitude.plot([], [], 'C0o', markersize=4)
+        self.magnitude_view = DecimatedLine(self.magnitude_line, stem=True,
+                                            markers=self.magnitude_markers)
+        self.ax_magnitude.set_title('Амплитудный спектр')
+        self.ax_magnitude.set_xlabel('Частота (Гц)')
+        self.ax_magnitude.set_ylabel('Амплитуда')
+        self.ax_magnitude.set_xlim([0, 50])
+        self.ax_magnitude.grid(True, alpha=0.3)
+
+        # Фазовый спектр
+        self.phase_line, = self.ax_phase.plot([], [], 'g-', linewidth=1.5)
+        self.phase_view = DecimatedLine(self.phase_line)
+        self.ax_phase.set_title('Фазовый спектр')
+        self.ax_phase.set_xlabel('Частота (Гц)')
+        self.ax_phase.set_ylabel('Фаза (рад)')
+        self.ax_phase.set_xlim([0, 50])
+        self.ax_phase.grid(True, alpha=0.3)
+
+        # Спектральная плотность мощности
+        self.psd_line, = self.ax_psd.semilogy([], [], 'r-', linewidth=1.5)
+        self.psd_view = DecimatedLine(self.psd_line)
+        self.ax_psd.set_title('Спектральная плотность мощности (метод Уэлча)')
+        self.ax_psd.set_xlabel('Частота (Гц)')
+        self.ax_psd.set_ylabel('Мощность / Гц')
+        self.ax_psd.set_xlim([0, 50])
+        self.ax_psd.grid(True, alpha=0.3)
+
+        with self.timer.span("tight_layout"):
+            self.figure.tight_layout()
+
+    def schedule_update(self):
+        """Отложенное обновление: события Scale за один кадр дают одну перерисовку"""
+        if self._pending_update is None:
+            self._pending_update = self.root.after(FRAME_INTERVAL_MS, self._run_scheduled_update)
+
+    def _run_scheduled_update(self):
+        self._pending_update = None
+        self.update_plots()
+
+
+    def get_params(self):
+        """Снимок параметров сигнала (переменные Tk читаются только в потоке GUI)"""
+        return {
+            "signal_type": self.signal_type.get(),
+            "frequency": self.frequency.get(),
+            "sampling_rate": self.sampling_rate.get(),
+            "amplitude": self.amplitude.get(),
+            "phase": self.phase.get(),
+            "add_noise": self.add_noise.get(),
+            "noise_level": self.noise_level.get(),
+            "noise_seed": self.noise_seed,
+            "fft_backend": self.fft_backend.get(),
+            "filter": self.filter_preset.get(),
+        }
+
+    def generate_signal(self, params=None):
+        """Генерация сигнала (по снимку параметров или текущим значениям)"""
+        if params is None:
+            params = self.get_params()
+        return generate_signal(params)
+
+    def update_plots(self):
+        """Обновление графиков: расчёт уходит в фоновый поток"""
+        try:
+            self.worker.submit(self.get_params())
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Произошла ошибка: {str(e)}")
+
+    def poll_worker(self):
+        """Передать готовые результаты фонового расчёта и запланировать следующий опрос"""
+        try:
+            self.worker.deliver()
+        finally:
+            self.root.after(RESULT_POLL_MS, self.poll_worker)
+
+    def new_noise(self):
+        """Новая реализация шума и перерасчёт"""
+        self.noise_seed += 1
+        self.update_plots()
+
+    def spectrum_cache_key(self, params):
+        """Ключ кэша спектров и множитель амплитуды.
+
+        Сигнал без шума (и его спектр после линейного фильтра) пропорционален
+        амплитуде: кэшируется результат для амплитуды 1, а нужный получается
+        умножением. Параметры шума в ключ такого сигнала не входят.
+        """
+        key_params = dict(params)
+        scale = 1.0
+        if not params["add_noise"]:
+            scale = params["amplitude"]
+            key_params["amplitude"] = 1.0
+            del key_params["noise_level"], key_params["noise_seed"]
+        return tuple(sorted(key_params.items())), scale
+
+    def compute_spectrum(self, params):
+        """Спектр из кэша или расчёт с сохранением в кэш (в фоновом потоке)"""
+        key, scale = self.spectrum_cache_key(params)
+        result = self.spectrum_cache.get(key)
+        cached = result is not None
+        if not cached:
+            unit_params = params if params["add_noise"] else dict(params, amplitude=1.0)
+            result = calculate_spectrum(unit_params, self.timer)
+            self.spectrum_cache.put(key, result)
+
+        if scale == 1.0:
+            return dict(result, cached=cached)
+        # Магнитуда и амплитуда по Гёрцелю - линейно, СПМ - квадратично; фаза не меняется
+        return dict(result, cached=cached,
+                    signal=result["signal"] * scale,
+                    magnitude=result["magnitude"] * scale,
+                    psd=result["psd"] * scale ** 2,
+                    target_amplitude=result["target_amplitude"] * scale)
+
+    def draw_spectrum(self, result):
+        """Вывод готового результата на графики (в потоке GUI)"""
+        try:
+            freq_axis = result["freq_axis"]
+            magnitude = result["magnitude"]
+
+            with self.timer.span("update_artists"):
+                # Графические объекты созданы один раз в setup_plots - здесь обновляются
+                # только их данные, прореженные до ширины осей (min/max по пикселям)
+                self.signal_view.set_data(result["t"], result["signal"])
+                self.magnitude_view.set_data(freq_axis, magnitude)
+                self.phase_view.set_data(freq_axis, result["phase"])
+                self.psd_view.set_data(result["psd_freq"], result["psd"])
+
+                # Пересчёт пределов осей по новым данным (ось частот зафиксирована)
+                for ax in (self.ax_signal, self.ax_phase, self.ax_psd):
+                    ax.relim()
+                    ax.autoscale_view()
+                self.ax_magnitude.set_ylim(0, max(magnitude.max(), 1e-12) * 1.05)
+
+            # Перерисовка при ближайшем простое цикла событий Tk
+            self.canvas_matplotlib.draw_idle()
+
+            # Обновление информации
+            self.update_info(result["fft_time"], magnitude, freq_axis, result["target_amplitude"],
+                             result["cached"])
+
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Произошла ошибка: {str(e)}")
+
+    def show_compute_error(self, error):
+        """Ошибка фонового расчёта (в потоке GUI)"""
+        messagebox.showerror("Ошибка", f"Произошла ошибка: {str(error)}")
+
+    def update_info(self, fft_time, magnitude, freq_axis, target_amplitude=None, cached=False):
+        """Обновление информационной панели"""
+        self.info_text.delete(1.0, tk.END)
+
+        # Поиск доминирующей частоты
+        peak_idx = np.argmax(magnitude)
+        peak_freq = freq_axis[peak_idx]
+        peak_amp = magnitude[peak_idx]
+
+        info = f"Время выполнения БПФ: {fft_time * 1000:.3f} мс"
+        info += " (спектр из кэша)\n" if cached else "\n"
+        info += f"Размер выборки: {self.sampling_rate.get()} точек\n"
+        info += f"Обнаруженная частота: {peak_freq:.2f} Гц (амплитуда: {peak_amp:.3f})\n"
+        info += f"Заданная частота: {self.frequency.get():.2f} Гц"
+        if target_amplitude is not None:
+            info += f" (амплитуда по Гёрцелю: {target_amplitude:.3f})"
+
+        hits, misses, entries, nbytes = self.spectrum_cache.stats()
+        info += (f"\nКэш спектров: попаданий {hits}, промахов {misses}, "
+                 f"записей {entries} ({nbytes / 2 ** 20:.1f} МБ)")
+
+        self.info_text.insert(1.0, info)
+
+        # Отрисовка текущего обновления ещё впереди - в таблице предыдущие замеры
+        self.stage_text.delete(1.0, tk.END)
+        self.stage_text.insert(1.0, format_stages(self.timer.summary(), PIPELINE_STAGES))
+
+    def export_profile(self):
+        """Дописать перцентили этапов в файл JSON Lines"""
+        path = filedialog.asksaveasfilename(title="Экспорт профиля", defaultextension=".jsonl",
+                                            filetypes=[("JSON Lines", "*.jsonl"), ("Все файлы", "*.*")])
+        if not path:
+            return
+        try:
+            self.timer.export_jsonl(path)
+        except OSError as e:
+            messagebox.showerror("Ошибка", f"Не удалось сохранить профиль: {str(e)}")
+
+    def compare_with_numpy(self):
+        """Сравнение с NumPy FFT"""
+        try:
+            t, signal = self.generate_signal()
+
+            # Наша реализация и NumPy: медиана повторных замеров после прогрева
+            our_fft = fft_iterative(signal)
+            our_samples, _ = measure(fft_iterative, signal)
+
+            numpy_fft = np.fft.fft(signal)
+            numpy_samples, _ = measure(np.fft.fft, signal)
+
+            our_stats = summarize(our_samples, len(signal))
+            numpy_stats = summarize(numpy_samples, len(signal))
+
+            # Вычисление ошибки
+            error = np.mean(np.abs(our_fft - numpy_fft))
+
+            result = f"Сравнение с NumPy FFT (медиана {len(our_samples)} замеров):\n\n"
+            result += (f"Время выполнения нашего БПФ: {our_stats['median_ns'] / 1e6:.4f} мс "
+                       f"(IQR {our_stats['iqr_ns'] / 1e6:.4f} мс)\n")
+            result += (f"Время выполнения NumPy FFT: {numpy_stats['median_ns'] / 1e6:.4f} мс "
+                       f"(IQR {numpy_stats['iqr_ns'] / 1e6:.4f} мс)\n")
+            result += f"Средняя абсолютная ошибка: {error:.2e}\n\n"
+
+            if error < 1e-10:
+                result += "✓ Результаты практически идентичны!"
+            else:
+                result += "⚠ Обнаружены небольшие расхождения"
+
+            messagebox.showinfo("Сравнение с NumPy", result)
+
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Ошибка при сравнении: {str(e)}")
+
+    def start_benchmark(self):
+        """Бенчмарк всех реализаций по сетке размеров (в фоновом потоке)"""
+        engines, limits = project_engines()
+
+        def work():
+            try:
+                results = run_benchmark(engines, sizes=GUI_BENCHMARK_SIZES, dtypes=["float64"],
+                                        trials=7, limits=limits)
+                self.root.after(0, lambda: self.show_benchmark(results))
+            except Exception as e:
+                self.root.after(0, lambda: messagebox.showerror("Ошибка", f"Ошибка бенчмарка: {str(e)}"))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def start_calibration(self):
+        """Калибровка реестра БПФ (в фоновом потоке) с сохранением в файл"""
+        def work():
+            try:
+                calibrate()
+                points = crossover_points()
+                text = "Калибровка сохранена в\n" + CALIBRATION_FILE + "\n\nЛучшая реализация:\n"
+                text += "\n".join(f"  N ≥ {n}: {name}" for n, name in points)
+                self.root.after(0, lambda: messagebox.showinfo("Калибровка", text))
+            except Exception as e:
+                self.root.after(0, lambda: messagebox.showerror("Ошибка", f"Ошибка калибровки: {str(e)}"))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def show_benchmark(self, results):
+        """Окно со сводкой бенчмарка"""
+        bench_window = tk.Toplevel(self.root)
+        bench_window.title("Бенчмарк БПФ")
+        bench_window.geometry("760x500")
+
+        text_widget = tk.Text(bench_window, wrap=tk.NONE, padx=10, pady=10, font=("Courier", 10))
+        text_widget.pack(fill=tk.BOTH, expand=True)
+        text_widget.insert(1.0, format_summary(results))
+        text_widget.config(state=tk.DISABLED)
+
+    def show_algorithm(self):
+        """Показать описание алгоритма"""
+        algorithm_text = """
+АЛГОРИТМ БЫСТРОГО ПРЕОБРАЗОВАНИЯ ФУРЬЕ (БПФ)
+
+Алгоритм Кули-Тьюки (Cooley-Tukey):
+
+1. ПРИНЦИП РАБОТЫ:
+   - Разделяй и властвуй (divide and conquer)
+   - Рекурсивное разбиение ДПФ размера N на два ДПФ размера N/2
+   - Сложность: O(N log N) вместо O(N²) для прямого ДПФ
+
+2. ОСНОВНЫЕ ШАГИ:
+   a) Разделение входного массива на четные и нечетные элементы
+   b) Рекурсивное вычисление БПФ для каждой половины
+   c) Объединение результатов с использованием поворотных множителей
+
+3. ПОВОРОТНЫЙ МНОЖИТЕЛЬ:
+   W_N^k = exp(-2πi·k/N)
+
+4. ФОРМУЛА ОБЪЕДИНЕНИЯ:
+   X[k] = E[k] + W_N^k · O[k]
+   X[k+N/2] = E[k] - W_N^k · O[k]
+
+   где E[k] - БПФ четных элементов
+       O[k] - БПФ нечетных элементов
+
+5. ПРОИЗВОЛЬНЫЙ РАЗМЕР:
+   - Степень 2 - классический алгоритм Кули-Тьюки по основанию 2
+   - N = 2^a·3^b·5^c - смешанное основание: ДПФ размера 3 и 5
+     объединяют подпреобразования, остаток - по основанию 2
+   - Остальные N (в т.ч. простые) - алгоритм Блюстейна (chirp-z):
+     ДПФ сводится к свёртке длины M ≥ 2N-1, M - степень 2
+
+6. ПРИМЕНЕНИЕ:
+   - Обработка сигналов
+   - Спектральный анализ
+   - Фильтрация
+   - Сжатие данных
+   - Умножение больших чисел
+        """
+
+        # Создание нового окна
+        algo_window = tk.Toplevel(self.root)
+        algo_window.title("Алгоритм БПФ")
+        algo_window.geometry("600x500")
+
+        text_widget = tk.Text(algo_window, wrap=tk.WORD, padx=10, pady=10)
+        text_widget.pack(fill=tk.BOTH, expand=True)
+        text_widget.insert(1.0, algorithm_text)
+        text_widget.config(state=tk.DISABLED)
+
+
+def main():
+    root = tk.Tk()
+    app = FFTApplication(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,110 @@
+# instrumentation.py
+# Лёгкие замеры времени этапов конвейера: интервалы (span) по именам этапов,
+# скользящие перцентили p50/p95/p99 по последним замерам и выгрузка в JSON Lines.
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# Сколько последних замеров каждого этапа учитывается в перцентилях
+ROLLING_WINDOW = 256
+
+PERCENTILES = (50, 95, 99)
+
+
+class StageTimer:
+    """Скользящая статистика длительностей по этапам.
+
+    with timer.span("fft"): ... - замер одного выполнения этапа.
+    Хранятся только window последних замеров каждого этапа, поэтому
+    память постоянна. Замеры можно вести из нескольких потоков.
+    """
+
+    def __init__(self, window=ROLLING_WINDOW):
+        self.window = window
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"StageTimer(stages={list(self._samples)}, window={self.window})"
+
+    @contextmanager
+    def span(self, stage):
+        """Замерить выполнение блока with как этап stage"""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter_ns() - start)
+
+    def record(self, stage, elapsed_ns):
+        """Добавить готовый замер (нс)"""
+        with self._lock:
+            if stage not in self._samples:
+                self._samples[stage] = deque(maxlen=self.window)
+                self._counts[stage] = 0
+            self._samples[stage].append(elapsed_ns)
+            self._counts[stage] += 1
+
+    def wrap(self, stage, func):
+        """Функция-обёртка: каждый вызов func замеряется как этап stage"""
+        def timed(*args, **kwargs):
+            with self.span(stage):
+                return func(*args, **kwargs)
+        return timed
+
+    def stages(self):
+        """Имена этапов в порядке первого замера"""
+        with self._lock:
+            return list(self._samples)
+
+    def percentiles(self, stage):
+        """{"count", "p50_ms", "p95_ms", "p99_ms", "max_ms"} по последним замерам этапа"""
+        with self._lock:
+            samples = np.array(self._samples.get(stage, ()), dtype=float)
+            count = self._counts.get(stage, 0)
+        stats = {"count": count}
+        if len(samples) == 0:
+            return stats
+        for p, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES)):
+            stats[f"p{p}_ms"] = value / 1e6
+        stats["max_ms"] = samples.max() / 1e6
+        return stats
+
+    def summary(self):
+        """Статистика всех этапов: имя -> percentiles(имя)"""
+        return {stage: self.percentiles(stage) for stage in self.stages()}
+
+    def export_jsonl(self, path):
+        """Дописать в файл по строке JSON на этап с отметкой времени.
+
+        Повторные выгрузки в один файл образуют ряд для поиска регрессий.
+        """
+        timestamp = time.time()
+        with open(path, "a", encoding="utf-8") as f:
+            for stage, stats in self.summary().items():
+                f.write(json.dumps({"timestamp": timestamp, "stage": stage, **stats},
+                                   ensure_ascii=False) + "\n")
+
+    def reset(self):
+        """Удалить все замеры"""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+def format_stages(summary, stages=None):
+    """Текстовая таблица перцентилей (мс)"""
+    lines = [f"{'этап':<18}{'p50':>9}{'p95':>9}{'p99':>9}{'замеров':>9}"]
+    for stage in stages or summary:
+        stats = summary.get(stage)
+        if not stats or "p50_ms" not in stats:
+            continue
+        lines.append(f"{stage:<18}{stats['p50_ms']:>9.3f}{stats['p95_ms']:>9.3f}"
+                     f"{stats['p99_ms']:>9.3f}{stats['count']:>9}")
+    return "\n".join(lines)
@@ -0,0 +1,184 @@
+# parallel_fft.py
+# Многоядерное БПФ очень больших размеров (2^22 и выше):
+# четырёхшаговый (шестишаговый) алгоритм с пулом потоков или процессов.
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from fft_engine import fft
+
+# Размер, начиная с которого преобразование распараллеливается
+PARALLEL_THRESHOLD = 1 << 20
+
+# Сколько порций работы приходится на одного исполнителя (балансировка нагрузки)
+CHUNKS_PER_WORKER = 4
+
+
+def split_size(N):
+    """Разложение N = N1·N2 с множителями, близкими к √N (N1 <= N2)"""
+    n1 = int(np.sqrt(N))
+    while n1 > 1 and N % n1:
+        n1 -= 1
+    return n1, N // n1
+
+
+@lru_cache(maxsize=8)
+def _twiddle_tables(N):
+    """Двухуровневая таблица W_N^j = W_N^(hi·S) · W_N^lo размером O(√N)"""
+    S = 1 << ((N.bit_length() + 1) // 2)
+    coarse = np.exp(-2j * np.pi * np.arange(0, N, S) / N)
+    fine = np.exp(-2j * np.pi * np.arange(S) / N)
+    return S, coarse, fine
+
+
+def _twiddle_rows(N, m, start, stop):
+    """Поправочные множители W_N^(n1·k1) для строк n1 = start..stop-1"""
+    S, coarse, fine = _twiddle_tables(N)
+    j = (np.arange(start, stop)[:, None] * np.arange(m)) % N
+    return coarse[j // S] * fine[j % S]
+
+
+def _row_pass(a, N, start, stop):
+    """Шаги 2-3: БПФ строк n1 = start..stop-1 длины N2 и умножение на W_N^(n1·k1)"""
+    rows = a[..., start:stop, :]
+    rows[...] = fft(rows)
+    rows *= _twiddle_rows(N, a.shape[-1], start, stop)
+
+
+def _column_pass(a, b, start, stop):
+    """Шаги 4-5: транспонирование и БПФ столбцов k1 = start..stop-1 длины N1"""
+    b[..., start:stop, :] = fft(a[..., :, start:stop].swapaxes(-1, -2))
+
+
+def _row_pass_shared(name, shape, N, start, stop):
+    """_row_pass в процессе-исполнителе над разделяемой памятью"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        _row_pass(np.ndarray(shape, dtype=complex, buffer=shm.buf), N, start, stop)
+    finally:
+        shm.close()
+
+
+def _column_pass_shared(a_name, a_shape, b_name, b_shape, start, stop):
+    """_column_pass в процессе-исполнителе над разделяемой памятью"""
+    shm_a = shared_memory.SharedMemory(name=a_name)
+    shm_b = shared_memory.SharedMemory(name=b_name)
+    try:
+        _column_pass(np.ndarray(a_shape, dtype=complex, buffer=shm_a.buf),
+                     np.ndarray(b_shape, dtype=complex, buffer=shm_b.buf),
+                     start, stop)
+    finally:
+        shm_a.close()
+        shm_b.close()
+
+
+def _chunks(count, parts):
+    """Разбиение range(count) на не более чем parts непрерывных отрезков"""
+    bounds = np.linspace(0, count, min(count, parts) + 1).astype(int)
+    return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+
+class ParallelFFT:
+    """Параллельное БПФ: N = N1·N2 раскладывается на подпреобразования.
+
+    1. x[n1 + N1·n2] раскладывается в матрицу N1 × N2 (транспонирование);
+    2. N1 строк длины N2 преобразуются параллельно;
+    3. результат умножается на поправочные множители W_N^(n1·k1);
+    4-5. столбцы транспонируются в строки и N2 БПФ длины N1 идут параллельно;
+    6. итоговое транспонирование даёт X[k1 + N2·k2].
+
+    executor="thread" - пул потоков (NumPy отпускает GIL в векторных
+    операциях), executor="process" - пул процессов над разделяемой памятью.
+    Преобразования короче threshold выполняются последовательно.
+    """
+
+    def __init__(self, workers=None, executor="thread", threshold=PARALLEL_THRESHOLD):
+        if executor not in ("thread", "process"):
+            raise ValueError("executor должен быть 'thread' или 'process'")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.threshold = threshold
+        self._pool = None
+
+    def __repr__(self):
+        return (f"ParallelFFT(workers={self.workers}, executor='{self.executor}', "
+                f"threshold={self.threshold})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Остановить пул исполнителей"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            pool_cls = ThreadPoolExecutor if self.executor == "thread" else ProcessPoolExecutor
+            self._pool = pool_cls(max_workers=self.workers)
+        return self._pool
+
+    def _run(self, func, count, *args):
+        """Запустить func(*args, start, stop) по порциям и дождаться всех"""
+        pool = self._get_pool()
+        futures = [pool.submit(func, *args, start, stop)
+                   for start, stop in _chunks(count, self.workers * CHUNKS_PER_WORKER)]
+        for future in futures:
+            future.result()
+
+    def fft(self, x, axis=-1):
+        """Прямое БПФ вдоль оси axis"""
+        x = np.asarray(x)
+        N = x.shape[axis]
+        n1, n2 = split_size(N)
+        if N < self.threshold or n1 == 1:
+            return fft(x, axis=axis)
+
+        x = np.moveaxis(x, axis, -1)
+        lead = x.shape[:-1]
+        a_shape = lead + (n1, n2)
+        b_shape = lead + (n2, n1)
+
+        if self.executor == "thread":
+            a = np.empty(a_shape, dtype=complex)
+            b = np.empty(b_shape, dtype=complex)
+            a[...] = x.reshape(lead + (n2, n1)).swapaxes(-1, -2)
+            self._run(_row_pass, n1, a, N)
+            self._run(_column_pass, n2, a, b)
+            result = b.swapaxes(-1, -2).reshape(lead + (N,))
+        else:
+            nbytes = int(np.prod(a_shape)) * np.dtype(complex).itemsize
+            shm_a = shared_memory.SharedMemory(create=True, size=nbytes)
+            shm_b = shared_memory.SharedMemory(create=True, size=nbytes)
+            try:
+                a = np.ndarray(a_shape, dtype=complex, buffer=shm_a.buf)
+                b = np.ndarray(b_shape, dtype=complex, buffer=shm_b.buf)
+                a[...] = x.reshape(lead + (n2, n1)).swapaxes(-1, -2)
+                self._run(_row_pass_shared, n1, shm_a.name, a_shape, N)
+                self._run(_column_pass_shared, n2, shm_a.name, a_shape, shm_b.name, b_shape)
+                result = b.swapaxes(-1, -2).reshape(lead + (N,))
+                # Представления должны быть освобождены до закрытия памяти
+                del a, b
+            finally:
+                shm_a.close()
+                shm_a.unlink()
+                shm_b.close()
+                shm_b.unlink()
+
+        return np.moveaxis(result, -1, axis)
+
+    def ifft(self, X, axis=-1):
+        """Обратное БПФ: IFFT(X) = conj(FFT(conj(X))) / N"""
+        X = np.asarray(X)
+        result = np.conj(self.fft(np.conj(X), axis=axis))
+        result /= X.shape[axis]
+        return result
@@ -0,0 +1,225 @@
+# signal_core.py
+# Вычислительное ядро приложения без GUI: генерация сигнала, собственные
+# реализации БПФ (рекурсивная и итеративная) и расчёт спектров.
+# Модуль не импортирует tkinter и matplotlib - его можно использовать
+# в пакетных задачах без дисплея (см. cli.py).
+
+import time
+from contextlib import nullcontext
+
+import numpy as np
+
+from backends import fft as dispatch_fft
+from backends import register_backend
+from fft_engine import fft, get_plan, is_power_of_two, radix2_butterflies, rfft
+from filters import apply_preset
+from goertzel import goertzel
+from welch import welch
+
+# Варианты выбора реализации помимо имён из реестра
+REAL_FFT_BACKEND = "rfft"
+AUTO_BACKEND = "auto"
+
+# Вариант выбора фильтра «без фильтрации» помимо FILTER_PRESETS
+NO_FILTER = "none"
+
+# Рекурсивная реализация медленная - в реестре ограничена этим размером
+RECURSIVE_MAX_SIZE = 4096
+
+# СПМ по Уэлчу: сигнал делится на сегменты длины N / WELCH_SEGMENT_DIVISOR (50% перекрытия)
+WELCH_SEGMENT_DIVISOR = 4
+WELCH_MIN_SEGMENT = 16
+# Окно Ханна короче этого сегмента состоит из нулей - берётся прямоугольное
+WELCH_MIN_HANN_SEGMENT = 3
+
+# Параметры сигнала по умолчанию (как начальные значения в GUI)
+DEFAULT_PARAMS = {
+    "signal_type": "sin",
+    "frequency": 5.0,
+    "sampling_rate": 256,
+    "amplitude": 1.0,
+    "phase": 0.0,
+    "add_noise": False,
+    "noise_level": 0.1,
+    "noise_seed": 0,
+    "fft_backend": REAL_FFT_BACKEND,
+    "filter": NO_FILTER,
+}
+
+
+def _span(timer, stage):
+    """Замер этапа, если передан StageTimer"""
+    return timer.span(stage) if timer is not None else nullcontext()
+
+
+def generate_signal(params=None):
+    """Генерация сигнала длительностью 1 с: (t, signal).
+
+    params - словарь параметров; недостающие берутся из DEFAULT_PARAMS.
+    Число отсчётов равно частоте дискретизации.
+    """
+    params = {**DEFAULT_PARAMS, **(params or {})}
+
+    N = params["sampling_rate"]
+    t = np.linspace(0, 1, N, endpoint=False)
+    freq = params["frequency"]
+    amp = params["amplitude"]
+    phase = params["phase"]
+
+    if params["signal_type"] == "sin":
+        signal = amp * np.sin(2 * np.pi * freq * t + phase)
+    else:
+        signal = amp * np.cos(2 * np.pi * freq * t + phase)
+
+    if params["add_noise"]:
+        rng = np.random.default_rng(params["noise_seed"])
+        noise = rng.normal(0, params["noise_level"], N)
+        signal = signal + noise
+
+    return t, signal
+
+
+def fft_recursive(x, out=None):
+    """Рекурсивная реализация БПФ (алгоритм Кули-Тьюки)"""
+    N = len(x)
+
+    # Размеры, не являющиеся степенью двойки - смешанное основание / Блюстейн
+    if not is_power_of_two(N):
+        return fft(x, out=out)
+
+    # Поворотные множители берутся из плана, а не пересчитываются на каждом уровне;
+    # все уровни пишут в один выходной массив и один рабочий буфер
+    plan = get_plan(N)
+    if out is None:
+        out = np.empty(N, dtype=complex)
+    scratch = np.empty(N // 2, dtype=complex)
+    _fft_recursive_step(np.asarray(x), out, scratch, plan.twiddles, N)
+    return out
+
+
+def _fft_recursive_step(x, out, scratch, twiddles, N_total):
+    """Один уровень рекурсии; W_n^k = W_N^(k·N/n) - срез общей таблицы"""
+    N = len(x)
+
+    # Базовый случай
+    if N == 1:
+        out[0] = x[0]
+        return
+
+    # Разделение на четные и нечетные элементы: БПФ половин пишутся
+    # прямо в левую и правую половины out
+    half = N // 2
+    _fft_recursive_step(x[0::2], out[:half], scratch, twiddles, N_total)
+    _fft_recursive_step(x[1::2], out[half:], scratch, twiddles, N_total)
+
+    # Поворотные множители
+    T = scratch[:half]
+    np.multiply(out[half:], twiddles[::N_total // N], out=T)
+
+    # Объединение результатов на месте
+    np.subtract(out[:half], T, out=out[half:])
+    np.add(out[:half], T, out=out[:half])
+
+
+def fft_iterative(x, axis=-1, out=None):
+    """Итеративная реализация БПФ (многоканальные данные - вдоль оси axis)"""
+    # Пакет каналов (..., N) преобразуется за один векторизованный проход
+    if np.ndim(x) > 1:
+        return fft(x, axis=axis, out=out)
+
+    N = len(x)
+
+    # Размеры, не являющиеся степенью двойки - смешанное основание / Блюстейн
+    if N & (N - 1) != 0:
+        return fft(x, out=out)
+
+    # Бит-реверсивная перестановка
+    x = bit_reverse_copy(x, out)
+
+    # Итеративное БПФ: каждый этап бабочек - векторная операция NumPy,
+    # поворотные множители берутся из кэшированного плана
+    radix2_butterflies(x, get_plan(N).twiddles)
+
+    return x
+
+
+def bit_reverse_copy(x, out=None):
+    """Бит-реверсивная перестановка (индексы из кэшированного плана) в out"""
+    N = len(x)
+    if out is None:
+        out = np.empty(N, dtype=complex)
+    np.take(np.asarray(x, dtype=complex), get_plan(N).bit_reverse, out=out, mode="clip")
+    return out
+
+
+# Собственные реализации - в общем реестре БПФ
+register_backend("iterative", fft_iterative)
+register_backend("recursive", fft_recursive, batched=False, max_size=RECURSIVE_MAX_SIZE)
+
+
+def signal_spectrum(signal, sampling_rate, fft_backend=REAL_FFT_BACKEND, filter_name=NO_FILTER,
+                    target_frequency=None, timer=None):
+    """Спектры готового сигнала: словарь с частотной осью, амплитудным и фазовым
+    спектрами (N/2 отсчётов), СПМ по Уэлчу и временем БПФ.
+
+    target_frequency - частота, амплитуда на которой считается алгоритмом Гёрцеля;
+    timer - необязательный StageTimer для замеров этапов.
+    """
+    signal = np.asarray(signal, dtype=float)
+
+    # КИХ-фильтр (быстрая свёртка через БПФ, без сдвига по времени)
+    if filter_name != NO_FILTER:
+        with _span(timer, "filter"):
+            signal = apply_preset(signal, filter_name, sampling_rate)
+
+    # Вычисление БПФ: по умолчанию сигнал вещественный, поэтому считаем только
+    # N/2+1 неизбыточных отсчётов (rfft - БПФ половинного размера);
+    # иначе - выбранная реализация из реестра или самая быстрая по калибровке
+    start_time = time.perf_counter()
+    with _span(timer, "fft"):
+        if fft_backend == REAL_FFT_BACKEND:
+            fft_result = rfft(signal)
+        else:
+            fft_result = dispatch_fft(signal, backend=None if fft_backend == AUTO_BACKEND else fft_backend)
+    fft_time = time.perf_counter() - start_time
+
+    with _span(timer, "spectrum"):
+        # Частотная ось
+        N = len(signal)
+        freq_axis = np.fft.fftfreq(N, d=1 / sampling_rate)[:N // 2]
+
+        # СПМ - усреднение периодограмм перекрывающихся сегментов (метод Уэлча)
+        segment = min(N, max(WELCH_MIN_SEGMENT, N // WELCH_SEGMENT_DIVISOR))
+        window = "hann" if segment >= WELCH_MIN_HANN_SEGMENT else "rect"
+        psd_freq, psd = welch(signal, sampling_rate, segment, window)
+
+        result = {
+            "signal": signal,
+            "freq_axis": freq_axis,
+            # Амплитудный спектр
+            "magnitude": 2.0 / N * np.abs(fft_result[:N // 2]),
+            # Фазовый спектр
+            "phase": np.angle(fft_result[:N // 2]),
+            # Спектральная плотность мощности
+            "psd_freq": psd_freq,
+            "psd": psd,
+            "fft_time": fft_time,
+        }
+        # Амплитуда на заданной частоте - алгоритм Гёрцеля, без БПФ
+        if target_frequency is not None:
+            result["target_amplitude"] = 2.0 / N * abs(goertzel(signal, [target_frequency],
+                                                                sampling_rate)[0])
+        return result
+
+
+def calculate_spectrum(params=None, timer=None):
+    """Генерация сигнала по параметрам и расчёт его спектров"""
+    params = {**DEFAULT_PARAMS, **(params or {})}
+
+    with _span(timer, "generate_signal"):
+        t, signal = generate_signal(params)
+
+    result = signal_spectrum(signal, params["sampling_rate"], params["fft_backend"],
+                             params["filter"], params["frequency"], timer)
+    result["t"] = t
+    return result
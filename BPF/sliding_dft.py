@@ -0,0 +1,85 @@
+# sliding_dft.py
+# Скользящее ДПФ: спектр окна из N последних отсчётов обновляется
+# за O(N) (O(K) для K выбранных частот) на каждый новый отсчёт вместо полного БПФ.
+
+import numpy as np
+
+from fft_engine import fft
+
+# Через сколько отсчётов спектр пересчитывается полным БПФ,
+# чтобы накопленная ошибка округления не росла
+RESYNC_INTERVAL = 4096
+
+
+class SlidingDFT:
+    """Спектр скользящего окна длины N.
+
+    Рекуррентное соотношение для каждой частоты k:
+    X_k ← (X_k - x_старый + x_новый) · exp(2πi·k/N),
+    где x_старый - отсчёт, выходящий из окна. Каждые resync_interval
+    отсчётов спектр пересчитывается заново через БПФ.
+    """
+
+    def __init__(self, N, bins=None, sampling_rate=None, resync_interval=RESYNC_INTERVAL):
+        if N < 1:
+            raise ValueError("Размер окна должен быть положительным")
+
+        self.N = N
+        # По умолчанию - неизбыточные частоты вещественного сигнала 0..N/2
+        self.bins = np.arange(N // 2 + 1) if bins is None else np.asarray(bins, dtype=int)
+        self.sampling_rate = N if sampling_rate is None else sampling_rate
+        self.resync_interval = resync_interval
+
+        self._rotation = np.exp(2j * np.pi * self.bins / N)
+        self._window = np.zeros(N)
+        self._pos = 0
+        self._since_resync = 0
+        self.spectrum = np.zeros(len(self.bins), dtype=complex)
+
+    def __repr__(self):
+        return f"SlidingDFT(N={self.N}, bins={len(self.bins)})"
+
+    def update(self, sample):
+        """Добавить один отсчёт и обновить спектр"""
+        old = self._window[self._pos]
+        self._window[self._pos] = sample
+        self._pos = (self._pos + 1) % self.N
+
+        self.spectrum += sample - old
+        self.spectrum *= self._rotation
+
+        self._since_resync += 1
+        if self._since_resync >= self.resync_interval:
+            self.resync()
+        return self.spectrum
+
+    def extend(self, samples):
+        """Добавить последовательность отсчётов"""
+        for sample in samples:
+            self.update(sample)
+        return self.spectrum
+
+    def window(self):
+        """Текущее окно в хронологическом порядке (от старого к новому)"""
+        return np.roll(self._window, -self._pos)
+
+    def resync(self):
+        """Пересчитать спектр полным БПФ окна"""
+        self.spectrum[:] = fft(self.window())[self.bins]
+        self._since_resync = 0
+
+    def frequencies(self):
+        """Частоты выбранных отсчётов спектра (Гц)"""
+        return self.bins * self.sampling_rate / self.N
+
+    def magnitude(self):
+        """Амплитудный спектр (как в update_plots: 2/N · |X|)"""
+        return 2.0 / self.N * np.abs(self.spectrum)
+
+    def phase(self):
+        """Фазовый спектр (рад)"""
+        return np.angle(self.spectrum)
+
+    def psd(self):
+        """Спектральная плотность мощности |X|² / N"""
+        return np.abs(self.spectrum) ** 2 / self.N
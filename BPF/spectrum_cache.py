@@ -0,0 +1,82 @@
+# spectrum_cache.py
+# LRU-кэш результатов расчёта спектра, ограниченный суммарным размером в байтах.
+# Значения - словари с массивами NumPy (как результат compute_spectrum).
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Предельный размер кэша по умолчанию
+SPECTRUM_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def result_nbytes(value):
+    """Оценка размера значения: сумма nbytes массивов словаря"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(result_nbytes(v) for v in value.values())
+    return 0
+
+
+class SpectrumCache:
+    """LRU-кэш с вытеснением по суммарному размеру значений.
+
+    Ключ - любой хешируемый кортеж параметров. Доступ защищён блокировкой:
+    запись идёт из фонового потока расчёта, счётчики читает поток GUI.
+    Значение больше max_bytes не кэшируется.
+    """
+
+    def __init__(self, max_bytes=SPECTRUM_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (f"SpectrumCache(entries={len(self)}, nbytes={self.nbytes}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Значение по ключу (None при промахе); найденное становится самым свежим"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """Сохранить значение, вытесняя самые старые записи сверх max_bytes"""
+        size = result_nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self.nbytes -= old_size
+
+    def clear(self):
+        """Очистить кэш и счётчики"""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """(попадания, промахи, записей, байт)"""
+        with self._lock:
+            return self.hits, self.misses, len(self._entries), self.nbytes
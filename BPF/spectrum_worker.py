@@ -0,0 +1,87 @@
+# spectrum_worker.py
+# Фоновый расчёт спектра вне цикла событий Tk.
+# Запросы, устаревшие до начала расчёта, отбрасываются; в GUI передаётся
+# только результат последнего запроса: поток кладёт его в очередь, а GUI
+# забирает её периодическим опросом (root.after) в своём потоке.
+
+import queue
+import threading
+
+# Период опроса готовых результатов из потока GUI, мс
+RESULT_POLL_MS = 20
+
+
+class SpectrumWorker:
+    """Фоновый поток: выполняет compute(params) только для самого свежего запроса.
+
+    Готовые результаты складываются в очередь; on_result и on_error вызывает
+    deliver() в потоке GUI (например, по таймеру root.after каждые
+    RESULT_POLL_MS). Фоновый поток сам не обращается к Tk, поэтому ошибки
+    Tk при запуске и закрытии окна не могут его остановить.
+    """
+
+    def __init__(self, compute, on_result, on_error):
+        self._compute = compute
+        self._on_result = on_result
+        self._on_error = on_error
+        self._results = queue.Queue()
+
+        self._cond = threading.Condition()
+        self._pending = None
+        self._generation = 0
+        self._stopped = False
+
+        self._thread = threading.Thread(target=self._loop, name="spectrum-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, params):
+        """Поставить запрос; ещё не начатый предыдущий запрос отменяется"""
+        with self._cond:
+            self._generation += 1
+            self._pending = (self._generation, params)
+            self._cond.notify()
+
+    def stop(self):
+        """Остановить поток (текущий расчёт будет доведён до конца и отброшен)"""
+        with self._cond:
+            self._stopped = True
+            self._generation += 1
+            self._pending = None
+            self._cond.notify()
+
+    def is_current(self, generation):
+        """Запрос generation всё ещё последний"""
+        with self._cond:
+            return generation == self._generation and not self._stopped
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                generation, params = self._pending
+                self._pending = None
+
+            try:
+                result = self._compute(params)
+                callback = self._on_result
+            except Exception as e:
+                result = e
+                callback = self._on_error
+
+            # Пока шёл расчёт, пользователь мог сдвинуть ползунок ещё раз
+            if self.is_current(generation):
+                self._results.put((generation, callback, result))
+
+    def deliver(self):
+        """Вызвать обработчики готовых результатов (только из потока GUI)"""
+        while True:
+            try:
+                generation, callback, result = self._results.get_nowait()
+            except queue.Empty:
+                return
+            # Повторная проверка уже в потоке GUI: новый запрос мог прийти после расчёта
+            if self.is_current(generation):
+                callback(result)
@@ -0,0 +1,96 @@
+# stft.py
+# Потоковое оконное преобразование Фурье (STFT) для записей, не помещающихся в память.
+# Файл с отсчётами отображается в память (memmap) и обходится перекрывающимися кадрами;
+# в каждый момент в памяти находится только один пакет кадров.
+
+import numpy as np
+
+from fft_engine import rfft
+
+# Оконные функции по имени
+WINDOWS = {
+    "rect": np.ones,
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+}
+
+# Сколько кадров преобразуется одним пакетным вызовом БПФ
+FRAMES_PER_BATCH = 64
+
+
+def open_signal(path, dtype="float32", offset=0):
+    """Отобразить файл с «сырыми» отсчётами (float32, int16, ...) в память"""
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset)
+
+
+def make_window(window, frame_size):
+    """Оконная функция: имя из WINDOWS или готовый массив длины frame_size"""
+    if isinstance(window, str):
+        if window not in WINDOWS:
+            raise ValueError(f"Неизвестное окно '{window}', доступны: {', '.join(WINDOWS)}")
+        return WINDOWS[window](frame_size)
+
+    window = np.asarray(window, dtype=float)
+    if window.shape != (frame_size,):
+        raise ValueError(f"Длина окна должна быть {frame_size}")
+    return window
+
+
+def frame_count(length, frame_size, hop):
+    """Число полных кадров длины frame_size с шагом hop"""
+    if length < frame_size:
+        return 0
+    return 1 + (length - frame_size) // hop
+
+
+def _to_float(chunk):
+    """Отсчёты в float64; целые типы нормируются к диапазону [-1, 1)"""
+    if np.issubdtype(chunk.dtype, np.integer):
+        return chunk.astype(float) / (np.iinfo(chunk.dtype).max + 1)
+    return chunk.astype(float)
+
+
+def stft_batches(signal, frame_size=1024, hop=None, window="hann", batch=FRAMES_PER_BATCH):
+    """Генератор пакетов спектрограммы: (номер первого кадра, массив (кадры, frame_size/2+1)).
+
+    signal может быть memmap любого размера: из него читается только
+    участок, покрывающий очередной пакет из batch кадров, поэтому пиковая
+    память ~ batch · frame_size и не зависит от длины записи.
+    Неполный последний кадр отбрасывается.
+    """
+    if hop is None:
+        hop = frame_size // 2
+    if frame_size < 1 or hop < 1:
+        raise ValueError("Размер кадра и шаг должны быть положительными")
+
+    win = make_window(window, frame_size)
+    total = frame_count(len(signal), frame_size, hop)
+
+    for first in range(0, total, batch):
+        count = min(batch, total - first)
+        start = first * hop
+        chunk = _to_float(signal[start:start + (count - 1) * hop + frame_size])
+        frames = np.lib.stride_tricks.sliding_window_view(chunk, frame_size)[::hop]
+        # Все кадры пакета - одним векторизованным rfft
+        yield first, rfft(frames * win)
+
+
+def stft(signal, frame_size=1024, hop=None, window="hann", batch=FRAMES_PER_BATCH):
+    """Генератор столбцов спектрограммы: rfft каждого кадра (frame_size/2+1 отсчётов)"""
+    for _, spectra in stft_batches(signal, frame_size, hop, window, batch):
+        yield from spectra
+
+
+def spectrogram_to_file(signal, out_path, frame_size=1024, hop=None, window="hann",
+                        batch=FRAMES_PER_BATCH):
+    """Записать мощность |X|² всех кадров в .npy-memmap формы (кадры, frame_size/2+1)"""
+    if hop is None:
+        hop = frame_size // 2
+
+    shape = (frame_count(len(signal), frame_size, hop), frame_size // 2 + 1)
+    out = np.lib.format.open_memmap(out_path, mode="w+", dtype=np.float32, shape=shape)
+    for first, spectra in stft_batches(signal, frame_size, hop, window, batch):
+        out[first:first + len(spectra)] = np.abs(spectra) ** 2
+    out.flush()
+    return out
@@ -0,0 +1,48 @@
+# test_fft_engine.py
+# Проверки БПФ плана: python -m unittest test_fft_engine (или pytest)
+
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from fft_engine import CONSTANT_GEOMETRY_MAX_SIZE, fft, ifft
+
+# Допустимый пик памяти на вызов: только объекты-представления NumPy,
+# без массивов данных (сигнал 2^16 отсчётов complex128 - 1 МБ)
+MAX_CALL_OVERHEAD_BYTES = 4096
+
+
+class FFTPlanTest(unittest.TestCase):
+    def test_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        for N in (1, 2, 8, 1024, 2 * CONSTANT_GEOMETRY_MAX_SIZE):
+            x = rng.standard_normal((3, N)) + 1j * rng.standard_normal((3, N))
+            np.testing.assert_allclose(fft(x), np.fft.fft(x), atol=1e-9 * N)
+            np.testing.assert_allclose(ifft(fft(x)), x, atol=1e-9)
+
+    def test_no_steady_state_allocation(self):
+        rng = np.random.default_rng(0)
+        for N in (256, 8192, CONSTANT_GEOMETRY_MAX_SIZE):
+            x = rng.standard_normal(N) + 1j * rng.standard_normal(N)
+            out = np.empty_like(x)
+            # первый вызов создаёт план и рабочие буферы
+            fft(x, out=out)
+            ifft(out, out=out)
+
+            tracemalloc.start()
+            try:
+                start = tracemalloc.get_traced_memory()[0]
+                for _ in range(10):
+                    fft(x, out=out)
+                    ifft(out, out=out)
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak - start, MAX_CALL_OVERHEAD_BYTES, f"N = {N}")
+            self.assertLess(current - start, MAX_CALL_OVERHEAD_BYTES, f"N = {N}")
+            np.testing.assert_allclose(out, x, atol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# welch.py
+# Оценка спектральной плотности мощности методом Уэлча: сигнал режется на
+# перекрывающиеся взвешенные окном сегменты, их периодограммы усредняются.
+# Сегменты обрабатываются пакетами по мере поступления отсчётов и сразу
+# суммируются в накопитель фиксированного размера - память не растёт с длиной записи.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from fft_engine import rfft
+from stft import FRAMES_PER_BATCH, _to_float, frame_count, make_window
+
+
+class WelchPSD:
+    """Потоковая оценка СПМ по Уэлчу.
+
+    update(chunk) принимает куски сигнала любой длины; между вызовами
+    хранится только неполный хвост (< segment_size отсчётов) и накопитель
+    суммы |X|² длины segment_size/2+1. Сегменты пакета из batch штук
+    преобразуются одним вызовом rfft; при workers > 1 пакеты одного куска
+    считаются параллельно в пуле потоков.
+    """
+
+    def __init__(self, segment_size=256, sampling_rate=1.0, window="hann", overlap=0.5,
+                 batch=FRAMES_PER_BATCH, workers=1):
+        if segment_size < 1:
+            raise ValueError("Размер сегмента должен быть положительным")
+        if not 0 <= overlap < 1:
+            raise ValueError("Перекрытие должно лежать в [0, 1)")
+
+        self.segment_size = segment_size
+        self.sampling_rate = sampling_rate
+        self.hop = max(1, segment_size - int(overlap * segment_size))
+        self.batch = batch
+        self.workers = workers or os.cpu_count() or 1
+        self.window = make_window(window, segment_size)
+        # Нормировка плотности: 1 / (fs · Σw²); окно Ханна из 1-2 отсчётов - нули
+        power = np.sum(self.window ** 2)
+        if power == 0:
+            raise ValueError(f"Окно из {segment_size} отсчётов нулевое - нужен сегмент длиннее "
+                             f"или другое окно")
+        self._scale = 1.0 / (sampling_rate * power)
+        self._pool = None
+        self.reset()
+
+    def __repr__(self):
+        return (f"WelchPSD(segment_size={self.segment_size}, hop={self.hop}, "
+                f"segments={self.segments})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Остановить пул потоков"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def reset(self):
+        """Обнулить накопитель"""
+        self._accumulator = np.zeros(self.segment_size // 2 + 1)
+        self._pending = np.zeros(0)
+        self.segments = 0
+
+    def _batch_power(self, frames):
+        """Сумма |X|² по сегментам пакета"""
+        return np.sum(np.abs(rfft(frames * self.window)) ** 2, axis=0)
+
+    def update(self, chunk):
+        """Добавить очередной кусок сигнала"""
+        data = np.concatenate((self._pending, _to_float(np.asarray(chunk))))
+        count = frame_count(len(data), self.segment_size, self.hop)
+        if count == 0:
+            self._pending = data
+            return self
+
+        frames = np.lib.stride_tricks.sliding_window_view(data, self.segment_size)[::self.hop][:count]
+        batches = [frames[i:i + self.batch] for i in range(0, count, self.batch)]
+        if self.workers > 1 and len(batches) > 1:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+            powers = self._pool.map(self._batch_power, batches)
+        else:
+            powers = map(self._batch_power, batches)
+        for power in powers:
+            self._accumulator += power
+
+        self.segments += count
+        # Следующий сегмент начинается с отсчёта count·hop
+        self._pending = data[count * self.hop:]
+        return self
+
+    def frequencies(self):
+        """Частоты отсчётов оценки (Гц)"""
+        return np.arange(self.segment_size // 2 + 1) * self.sampling_rate / self.segment_size
+
+    def psd(self):
+        """Односторонняя СПМ (ед.²/Гц), усреднённая по всем сегментам"""
+        if self.segments == 0:
+            raise ValueError("Сигнал короче одного сегмента")
+        psd = self._accumulator * (self._scale / self.segments)
+        # Мощность отрицательных частот переносится на положительные (кроме 0 и fs/2)
+        last = None if self.segment_size % 2 else -1
+        psd[1:last] *= 2
+        return psd
+
+
+def welch(signal, sampling_rate=1.0, segment_size=256, window="hann", overlap=0.5,
+          batch=FRAMES_PER_BATCH, workers=1):
+    """СПМ сигнала (массив или memmap любой длины) по Уэлчу: (частоты, СПМ).
+
+    Сигнал читается кусками по batch сегментов, поэтому пиковая память
+    ~ batch · segment_size.
+    """
+    with WelchPSD(segment_size, sampling_rate, window, overlap, batch, workers) as estimator:
+        step = batch * estimator.hop * max(1, estimator.workers)
+        for start in range(0, len(signal), step):
+            estimator.update(signal[start:start + step])
+        return estimator.frequencies(), estimator.psd()
@@ -2,9 +2,46 @@
 # Брутфорс-атака по ключам длины <= max_key_len
 # Внимание: пространство ключей растёт экспоненциально -> ограничение max_key_len (например 1..5)
 
+import heapq
 import itertools
+import math
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from collections import Counter
+from operator import mul
 from cipher import vigenere_decrypt, get_alphabets
-from utils import suggest_top_candidates
+from utils import (chi_squared_score, index_of_coincidence, language_ic, friedman_estimate,
+                   get_freq_table)
+
+# NumPy не обязателен: с ним подсчёт по столбцам для всех длин занимает миллисекунды
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# как часто (в проверенных ключах) перебор сообщает текущий топ кандидатов
+BRUTE_FORCE_REPORT_EVERY = 5000
+
+# как часто (в проверенных ключах) перебор проверяет флаг остановки
+STOP_CHECK_EVERY = 64
+
+# параллельный перебор: диапазонов ключей на процесс и период опроса отмены (с)
+PARALLEL_CHUNKS_PER_WORKER = 8
+CANCEL_POLL_INTERVAL = 0.2
+
+# длина повторяющихся n-грамм для метода Касиски
+KASISKI_NGRAM = 3
+
+# минимум букв в столбце при оценке длины ключа: в более коротких столбцах IC - шум
+MIN_COLUMN_LETTERS = 10
+
+# длина, кратная меньшей длине d, отбрасывается, если IC столбцов для d ниже
+# не больше чем на столько стандартных ошибок IC - её объясняет d
+DIVISOR_NOISE_MARGIN = 2
+
+# сколько самых вероятных длин ключа проверяет частотная атака
+KEY_LENGTH_CANDIDATES = 3
 
 def generate_keys(alphabet: str, max_len: int):
     # генерирует все ключи длины 1..max_len из alphabet
@@ -12,21 +49,319 @@ def generate_keys(alphabet: str, max_len: int):
         for tup in itertools.product(alphabet, repeat=L):
             yield "".join(tup)
 
-def brute_force(ciphertext: str, lang: str="ru", max_key_len: int=3, top_n:int=50, known_plaintext: str=None):
-    lower_alpha, upper_alpha = get_alphabets(lang)
-    alphabet = lower_alpha  # используем нижний регистр для генерации ключей
-    candidates = []
+def _key_at(alphabet: str, index: int) -> str:
+    # ключ с номером index в порядке generate_keys: сначала все ключи длины 1, затем 2, ...
+    m = len(alphabet)
+    L = 1
+    while index >= m ** L:
+        index -= m ** L
+        L += 1
+    digits = []
+    for _ in range(L):
+        index, d = divmod(index, m)
+        digits.append(alphabet[d])
+    return "".join(reversed(digits))
+
+def _keys_in_range(alphabet: str, start: int, stop: int):
+    # ключи с номерами start..stop-1 (как срез generate_keys, но без перебора начала)
+    m = len(alphabet)
+    digits = [alphabet.index(ch) for ch in _key_at(alphabet, start)] if stop > start else []
+    for _ in range(start, stop):
+        yield "".join(alphabet[d] for d in digits)
+        # следующий ключ: +1 в системе счисления по основанию m, после "яяя" - "аааа"
+        i = len(digits) - 1
+        while i >= 0 and digits[i] == m - 1:
+            digits[i] = 0
+            i -= 1
+        if i >= 0:
+            digits[i] += 1
+        else:
+            digits.insert(0, 0)
+
+def _scan_keys(ciphertext: str, lang: str, numbered_keys, top_n: int, known_plaintext: str=None,
+               on_candidates=None, report_every: int=BRUTE_FORCE_REPORT_EVERY, stop_event=None):
+    # общий цикл перебора: numbered_keys - пары (номер ключа в generate_keys, ключ).
+    # Каждая расшифровка оценивается сразу (chi2), в памяти - только top_n лучших:
+    # куча по (-score, -номер), в корне худший из лучших, он и вытесняется.
+    # При равной оценке выше остаётся ключ с меньшим номером.
+    # stop_event (threading/multiprocessing Event) прерывает перебор.
+    # Возвращает (результат без кандидатов, куча).
+    freq_alphabet, freq_map = get_freq_table(lang)
+    heap = []
     cnt = 0
-    # предупреждение: делать осторожно (в GUI будет прогресс)
-    for key in generate_keys(alphabet, max_key_len):
+    for index, key in numbered_keys:
+        if stop_event is not None and cnt % STOP_CHECK_EVERY == 0 and stop_event.is_set():
+            return {"found": False, "tested": cnt, "cancelled": True}, heap
         dec = vigenere_decrypt(ciphertext, key, lang=lang)
         cnt += 1
         if known_plaintext:
             # простая быстрая проверка: если known_plaintext содержится в dec -> считаем найдено
             if known_plaintext in dec:
-                return {"found": True, "key": key, "plaintext": dec, "tested": cnt}
-        # не сохраняем все — сохраняем некоторую выборку
-        candidates.append((key, dec))
-    # ранжируем по статистике
-    scored = suggest_top_candidates(candidates, lang, top_n=top_n)
-    return {"found": False, "tested": cnt, "candidates": scored}
+                return {"found": True, "key": key, "plaintext": dec, "tested": cnt}, heap
+        entry = (-chi_squared_score(dec, freq_alphabet, freq_map), -index, key, dec)
+        if len(heap) < top_n:
+            heapq.heappush(heap, entry)
+        elif top_n > 0 and entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+        if on_candidates is not None and cnt % report_every == 0:
+            on_candidates(_ranked(heap), cnt)
+    return {"found": False, "tested": cnt}, heap
+
+def _ranked(heap: list):
+    # содержимое кучи -> список (score, key, plaintext) по возрастанию оценки
+    return [(-neg_sc, key, dec) for neg_sc, _, key, dec in sorted(heap, reverse=True)]
+
+def brute_force(ciphertext: str, lang: str="ru", max_key_len: int=3, top_n:int=50, known_plaintext: str=None,
+                on_candidates=None, report_every: int=BRUTE_FORCE_REPORT_EVERY, stop_event=None):
+    # перебор в текущем потоке; on_candidates(candidates, tested) вызывается каждые
+    # report_every ключей с текущим топом (в формате результата) - для постепенного вывода
+    lower_alpha, upper_alpha = get_alphabets(lang)
+    alphabet = lower_alpha  # используем нижний регистр для генерации ключей
+    # предупреждение: делать осторожно (в GUI будет прогресс)
+    res, heap = _scan_keys(ciphertext, lang, enumerate(generate_keys(alphabet, max_key_len)), top_n,
+                           known_plaintext, on_candidates, report_every, stop_event)
+    if not res["found"]:
+        res["candidates"] = _ranked(heap)
+    return res
+
+# флаг остановки, общий для процессов пула (передаётся при их запуске)
+_worker_stop_event = None
+
+def _init_worker(stop_event):
+    global _worker_stop_event
+    _worker_stop_event = stop_event
+
+def _brute_force_range(ciphertext: str, lang: str, start: int, stop: int, top_n: int, known_plaintext: str=None):
+    # задача процесса пула: перебор ключей с номерами start..stop-1 со своим топом
+    alphabet, _ = get_alphabets(lang)
+    res, heap = _scan_keys(ciphertext, lang, zip(itertools.count(start), _keys_in_range(alphabet, start, stop)),
+                           top_n, known_plaintext, stop_event=_worker_stop_event)
+    if res["found"]:
+        # остальные процессы прекращают перебор
+        _worker_stop_event.set()
+    return res, heap
+
+def parallel_brute_force(ciphertext: str, lang: str="ru", max_key_len: int=3, top_n: int=50,
+                         known_plaintext: str=None, workers: int=None, on_candidates=None, cancel_event=None):
+    # брутфорс в нескольких процессах (обход GIL): пространство ключей generate_keys
+    # делится на непересекающиеся диапазоны номеров, каждый процесс ведёт свой топ,
+    # топы объединяются по мере завершения диапазонов (on_candidates(candidates, tested)).
+    # Совпадение с known_plaintext или cancel_event (threading.Event) останавливают все процессы.
+    # При нескольких совпадениях возвращается первое найденное, не обязательно с меньшим номером.
+    # Результат - в формате brute_force (+ "cancelled": True при отмене).
+    alphabet, _ = get_alphabets(lang)
+    workers = workers or os.cpu_count() or 1
+    total = sum(len(alphabet) ** L for L in range(1, max_key_len + 1))
+    # диапазонов больше, чем процессов: равномерная загрузка и частые промежуточные итоги
+    chunks = max(1, min(total, workers * PARALLEL_CHUNKS_PER_WORKER))
+    bounds = [total * i // chunks for i in range(chunks + 1)]
+
+    stop_event = multiprocessing.Event()
+    merged = []
+    tested = 0
+    found = None
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(stop_event,)) as pool:
+        pending = {pool.submit(_brute_force_range, ciphertext, lang, start, stop, top_n, known_plaintext)
+                   for start, stop in zip(bounds, bounds[1:])}
+        while pending:
+            done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            if cancel_event is not None and cancel_event.is_set():
+                stop_event.set()
+            for future in done:
+                if future.cancelled():
+                    continue
+                res, heap = future.result()
+                tested += res["tested"]
+                if res["found"] and found is None:
+                    found = res
+                merged = heapq.nlargest(top_n, merged + heap)
+            if stop_event.is_set():
+                # ещё не начатые диапазоны снимаются, начатые завершатся по флагу
+                for future in pending:
+                    future.cancel()
+            if done and on_candidates is not None and found is None:
+                on_candidates(_ranked(merged), tested)
+
+    if found is not None:
+        return {**found, "tested": tested}
+    res = {"found": False, "tested": tested, "candidates": _ranked(merged)}
+    if stop_event.is_set():
+        res["cancelled"] = True
+    return res
+
+def extract_letters(text: str, lang: str="ru") -> str:
+    # только буквы алфавита, в нижнем регистре (ключ сдвигает только их)
+    lower_alpha, _ = get_alphabets(lang)
+    letters = set(lower_alpha)
+    return "".join(ch for ch in text.lower() if ch in letters)
+
+def _column_square_sums(text: str, alphabet: str, max_len: int):
+    # для каждой длины L = 1..max_len: сумма квадратов частот букв по всем столбцам text[j::L]
+    if np is not None:
+        index = {ch: i for i, ch in enumerate(alphabet)}
+        codes = np.array([index[ch] for ch in text], dtype=np.int64)
+        positions = np.arange(len(text))
+        sums = []
+        for L in range(1, max_len + 1):
+            # номер пары (столбец, буква) -> одна гистограмма на длину
+            counts = np.bincount((positions % L) * len(alphabet) + codes)
+            sums.append(int(np.dot(counts, counts)))
+        return sums
+
+    sums = []
+    for L in range(1, max_len + 1):
+        total = 0
+        for j in range(L):
+            counts = Counter(text[j::L]).values()
+            total += sum(map(mul, counts, counts))
+        sums.append(total)
+    return sums
+
+def estimate_key_lengths(ciphertext: str, lang: str="ru", max_len: int=100, top_n: int=10):
+    # ранжирование вероятных длин ключа 1..max_len без перебора ключей:
+    #  - Касиски: доля расстояний между повторами n-грамм, кратных длине;
+    #  - индекс совпадений (IC) столбцов: при верной длине каждый столбец -
+    #    шифр Цезаря и его IC близок к IC языка, иначе - к 1/|алфавит|.
+    # Длины проверяются, пока в столбце не меньше MIN_COLUMN_LETTERS букв; кратные длины,
+    # которые объясняет их делитель, в список не попадают.
+    # Возвращает список (длина, оценка, средний IC столбцов, доля Касиски) по убыванию оценки
+    # и оценку длины по Фридману.
+    text = extract_letters(ciphertext, lang)
+    n = len(text)
+    if n < 2:
+        raise ValueError("В шифртексте слишком мало букв выбранного алфавита.")
+    # в каждом столбце нужно хотя бы MIN_COLUMN_LETTERS букв
+    max_len = max(1, min(max_len, n // MIN_COLUMN_LETTERS))
+
+    # Касиски: позиции n-грамм за один проход, затем гистограмма расстояний
+    last_pos = {}
+    spacing_hist = [0] * n
+    for i in range(n - KASISKI_NGRAM + 1):
+        gram = text[i:i + KASISKI_NGRAM]
+        if gram in last_pos:
+            spacing_hist[i - last_pos[gram]] += 1
+        last_pos[gram] = i
+    spacings = sum(spacing_hist)
+
+    lower_alpha, _ = get_alphabets(lang)
+    kr = 1.0 / len(lower_alpha)
+    kp = language_ic(lang)
+
+    ranked = []
+    ic_scores = {}
+    square_sums = _column_square_sums(text, lower_alpha, max_len)
+    for L in range(1, max_len + 1):
+        # IC, объединённый по столбцам: совпадающие пары букв / все пары внутри столбцов
+        q, r = divmod(n, L)
+        pairs = r * (q + 1) * q + (L - r) * q * (q - 1)
+        ic = (square_sums[L - 1] - n) / pairs
+        # 1 - IC языка, 0 - случайный текст
+        ic_scores[L] = (ic - kr) / (kp - kr)
+        # стандартная ошибка IC случайного текста по pairs парам (в тех же долях):
+        # чем короче столбцы, тем больше шум
+        noise = math.sqrt(2 * kr / pairs) / (kp - kr)
+        # кратные верной длины дают тот же IC: такую длину объясняет её делитель.
+        # IC выше языкового (повторы слов на кратных расстояниях) не довод в пользу L
+        threshold = min(ic_scores[L], 1.0) - DIVISOR_NOISE_MARGIN * noise
+        if any(ic_scores[d] >= threshold for d in range(1, L) if L % d == 0):
+            continue
+        # число расстояний, кратных L: сумма по срезу гистограммы
+        kasiski = sum(spacing_hist[L::L]) / spacings if spacings and L > 1 else 0.0
+        # IC учитывается с поправкой на шум - нижняя граница вместо самой оценки
+        ranked.append((L, ic_scores[L] - noise + kasiski, ic, kasiski))
+
+    ranked.sort(key=lambda r: (-r[1], r[0]))
+    friedman = friedman_estimate(index_of_coincidence(text), n, lang)
+    return ranked[:top_n], friedman
+
+def column_shift_scores(column: str, alphabet: str, freqs: list):
+    # chi-squared столбца после сдвига на каждую букву ключа: список (chi2, сдвиг) по возрастанию
+    m = len(alphabet)
+    counts = Counter(column)
+    observed = [counts.get(ch, 0) for ch in alphabet]
+    n = len(column)
+    expected = [p * n + 1e-9 for p in freqs]
+    scores = []
+    for shift in range(m):
+        # буква открытого текста a была зашифрована в (a + shift) mod m
+        chi2 = sum((observed[(a + shift) % m] - e) ** 2 / e for a, e in enumerate(expected))
+        scores.append((chi2, shift))
+    scores.sort()
+    return scores
+
+def _best_shift_combinations(columns_scores: list, count: int):
+    # count наборов сдвигов с наименьшей суммой chi2 (столбцы независимы):
+    # от лучшего набора шаг за шагом заменяем в одном столбце вариант на следующий по рангу
+    start = tuple(0 for _ in columns_scores)
+    total = sum(scores[0][0] for scores in columns_scores)
+    heap = [(total, start)]
+    seen = {start}
+    result = []
+    while heap and len(result) < count:
+        total, ranks = heapq.heappop(heap)
+        result.append((total, [columns_scores[j][r][1] for j, r in enumerate(ranks)]))
+        for j, r in enumerate(ranks):
+            if r + 1 < len(columns_scores[j]):
+                nxt = ranks[:j] + (r + 1,) + ranks[j + 1:]
+                if nxt not in seen:
+                    seen.add(nxt)
+                    delta = columns_scores[j][r + 1][0] - columns_scores[j][r][0]
+                    heapq.heappush(heap, (total + delta, nxt))
+    return result
+
+def _minimal_period(key: str) -> str:
+    # "abcabc" -> "abc": ключ кратной длины даёт ту же расшифровку
+    for L in range(1, len(key)):
+        if len(key) % L == 0 and key[:L] * (len(key) // L) == key:
+            return key[:L]
+    return key
+
+def frequency_attack(ciphertext: str, lang: str="ru", key_lengths: list=None, max_key_len: int=100,
+                     top_n: int=10, known_plaintext: str=None):
+    # частотная атака: при известной длине L столбцы text[j::L] - независимые шифры Цезаря;
+    # каждая буква ключа подбирается по chi-squared своего столбца
+    # (|алфавит|·L оценок вместо |алфавит|^L расшифровок).
+    # Длины берутся из estimate_key_lengths, если не заданы явно.
+    # Результат - в формате brute_force; tested - число оценённых пар (столбец, сдвиг).
+    lower_alpha, _ = get_alphabets(lang)
+    _, freq_map = get_freq_table(lang)
+    freqs = [freq_map.get(ch, 0) for ch in lower_alpha]
+    text = extract_letters(ciphertext, lang)
+    if not text:
+        raise ValueError("В шифртексте нет букв выбранного алфавита.")
+    if key_lengths is None:
+        ranked, _ = estimate_key_lengths(ciphertext, lang, max_len=max_key_len, top_n=KEY_LENGTH_CANDIDATES)
+        key_lengths = [L for L, *_ in ranked]
+
+    # оценка кандидата - сумма chi2 по столбцам; с ростом длины она всегда падает
+    # (подгонка под шум), поэтому оценки разных длин не сравниваются: места в топе
+    # делятся между длинами по кругу - сначала лучший ключ каждой длины (по рангу
+    # длины), затем вторые и т.д.
+    per_length = []
+    tested = 0
+    for L in key_lengths:
+        columns_scores = [column_shift_scores(text[j::L], lower_alpha, freqs) for j in range(L)]
+        tested += L * len(lower_alpha)
+        per_length.append(iter(_best_shift_combinations(columns_scores, top_n)))
+
+    seen = set()
+    scored = []
+    while per_length and len(scored) < top_n:
+        for combinations in list(per_length):
+            candidate = next(combinations, None)
+            if candidate is None:
+                per_length.remove(combinations)
+                continue
+            total, shifts = candidate
+            key = _minimal_period("".join(lower_alpha[s] for s in shifts))
+            if key in seen:
+                continue
+            seen.add(key)
+            dec = vigenere_decrypt(ciphertext, key, lang=lang)
+            if known_plaintext and known_plaintext in dec:
+                return {"found": True, "key": key, "plaintext": dec, "tested": tested}
+            scored.append((total, key, dec))
+            if len(scored) == top_n:
+                break
+
+    return {"found": False, "tested": tested, "candidates": scored}
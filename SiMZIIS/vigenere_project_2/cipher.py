@@ -2,13 +2,25 @@
 # Исправленная реализация шифра Виженера — поддерживает русский и английский алфавиты,
 # сохраняет регистр и сохраняет небуквенные символы.
 
+import itertools
+import re
+from functools import lru_cache
 from typing import Tuple
 
+# NumPy не обязателен: с ним текст шифруется как массив кодов символов
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 RUS_LOWER = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
 RUS_UPPER = RUS_LOWER.upper()
 ENG_LOWER = "abcdefghijklmnopqrstuvwxyz"
 ENG_UPPER = ENG_LOWER.upper()
 
+# однобайтовые кодировки, в которых представимы все буквы алфавита
+ALPHABET_CODECS = {RUS_LOWER: "cp1251", ENG_LOWER: "ascii"}
+
 def get_alphabets(lang: str) -> Tuple[str,str]:
     lang = lang.lower()
     if lang.startswith("ru"):
@@ -16,67 +28,107 @@ def get_alphabets(lang: str) -> Tuple[str,str]:
     else:
         return ENG_LOWER, ENG_UPPER
 
-def _shift_char(ch: str, key_ch: str, encrypt: bool, lower_alpha: str, upper_alpha: str) -> str:
-    # выбираем базовый алфавит в зависимости от регистра символа plaintext/ciphertext
-    if ch.islower() and ch in lower_alpha:
-        base = lower_alpha
-        key_norm = key_ch.lower()
-    elif ch.isupper() and ch in upper_alpha:
-        base = upper_alpha
-        key_norm = key_ch.upper()
-    else:
-        # либо не буква, либо буква другого алфавита — возвращаем как есть
-        return ch
-
-    # теперь убедимся, что ключевой символ в том же алфавите/регистре, что и base
-    if key_norm not in base:
-        # даём понятную ошибку — это защитит от смешивания алфавитов в ключе
-        raise ValueError(f"Символ ключа '{key_ch}' не принадлежит выбранному алфавиту/регистру.")
-    m = len(base)
-    a_idx = base.index(ch)
-    k_idx = base.index(key_norm)
-    if encrypt:
-        new_idx = (a_idx + k_idx) % m
-    else:
-        new_idx = (a_idx - k_idx + m) % m
-    return base[new_idx]
-
-def _normalize_key_for_text(key: str, text: str, lower_alpha: str, upper_alpha: str):
-    # Убираем из ключа символы не в выбранном алфавите (ни в lower, ни в upper)
-    filtered_key = "".join([ch for ch in key if (ch.lower() in lower_alpha) or (ch.upper() in upper_alpha)])
-    if not filtered_key:
-        raise ValueError("Ключ не содержит букв выбранного алфавита.")
-    # Сформировать последовательность ключевых символов для каждой буквы текста,
-    # пропуская небуквенные символы (оставляя None на их местах)
-    key_seq = []
-    klen = len(filtered_key)
-    ki = 0
-    for ch in text:
-        if (ch.islower() and ch in lower_alpha) or (ch.isupper() and ch in upper_alpha):
-            key_seq.append(filtered_key[ki % klen])
-            ki += 1
-        else:
-            key_seq.append(None)
-    return key_seq
+# Скомпилированный контекст шифра: таблицы сдвига для каждой позиции ключа.
+# Буквы текста шифруются пачками: с NumPy - весь текст одним векторным проходом
+# по массиву кодов символов; без него буквы одного класса вычетов (номер буквы
+# mod длина ключа) сдвигаются одним вызовом bytes.translate.
 
-def vigenere_encrypt(plaintext: str, key: str, lang: str="ru") -> str:
+@lru_cache(maxsize=None)
+def _shift_table(lang: str, shift: int) -> bytes:
+    # таблица bytes.translate: каждая буква алфавита (обоих регистров) -> сдвинутая на shift
     lower_alpha, upper_alpha = get_alphabets(lang)
-    key_seq = _normalize_key_for_text(key, plaintext, lower_alpha, upper_alpha)
-    out = []
-    for ch, kch in zip(plaintext, key_seq):
-        if kch is None:
-            out.append(ch)
-        else:
-            out.append(_shift_char(ch, kch, True, lower_alpha, upper_alpha))
-    return "".join(out)
+    codec = ALPHABET_CODECS[lower_alpha]
+    shift %= len(lower_alpha)
+    return bytes.maketrans((lower_alpha + upper_alpha).encode(codec),
+                           (lower_alpha[shift:] + lower_alpha[:shift] +
+                            upper_alpha[shift:] + upper_alpha[:shift]).encode(codec))
 
-def vigenere_decrypt(ciphertext: str, key: str, lang: str="ru") -> str:
+@lru_cache(maxsize=None)
+def _letter_runs_pattern(lang: str):
+    # разбиение текста на участки из букв алфавита и участки прочих символов
+    lower_alpha, upper_alpha = get_alphabets(lang)
+    return re.compile(f"([^{re.escape(lower_alpha + upper_alpha)}]+)")
+
+@lru_cache(maxsize=None)
+def _code_tables(lang: str):
+    # таблицы по кодам символов: номер буквы в алфавите (-1 - не буква), признак
+    # верхнего регистра, коды букв алфавита в нижнем и верхнем регистре
     lower_alpha, upper_alpha = get_alphabets(lang)
-    key_seq = _normalize_key_for_text(key, ciphertext, lower_alpha, upper_alpha)
-    out = []
-    for ch, kch in zip(ciphertext, key_seq):
-        if kch is None:
-            out.append(ch)
-        else:
-            out.append(_shift_char(ch, kch, False, lower_alpha, upper_alpha))
-    return "".join(out)
+    size = max(map(ord, lower_alpha + upper_alpha)) + 1
+    index = np.full(size, -1, dtype=np.int64)
+    is_upper = np.zeros(size, dtype=bool)
+    for i, (lo, up) in enumerate(zip(lower_alpha, upper_alpha)):
+        index[ord(lo)] = index[ord(up)] = i
+        is_upper[ord(up)] = True
+    lower_codes = np.array([ord(ch) for ch in lower_alpha], dtype=np.uint32)
+    upper_codes = np.array([ord(ch) for ch in upper_alpha], dtype=np.uint32)
+    return index, is_upper, lower_codes, upper_codes
+
+class CipherContext:
+    # ключ, подготовленный для языка: сдвиги по позициям ключа и таблицы перевода
+    def __init__(self, key: str, lang: str="ru"):
+        lower_alpha, upper_alpha = get_alphabets(lang)
+        # Убираем из ключа символы не в выбранном алфавите (ни в lower, ни в upper)
+        filtered_key = "".join([ch for ch in key if (ch.lower() in lower_alpha) or (ch.upper() in upper_alpha)])
+        if not filtered_key:
+            raise ValueError("Ключ не содержит букв выбранного алфавита.")
+        self.lang = lang
+        self.key = filtered_key
+        self.m = len(lower_alpha)
+        self.codec = ALPHABET_CODECS[lower_alpha]
+        self.shifts = [lower_alpha.index(ch.lower()) for ch in filtered_key]
+
+    def __repr__(self):
+        return f"CipherContext(key={self.key!r}, lang={self.lang!r})"
+
+    def _transform_numpy(self, text: str, shifts: list) -> str:
+        index, is_upper, lower_codes, upper_codes = _code_tables(self.lang)
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).copy()
+        letter_idx = np.full(len(codes), -1, dtype=np.int64)
+        known = codes < len(index)
+        letter_idx[known] = index[codes[known]]
+        letters = letter_idx >= 0
+        # i-я буква текста сдвигается на ключевой символ i mod длина ключа
+        key_pos = np.arange(np.count_nonzero(letters)) % len(shifts)
+        new_idx = (letter_idx[letters] + np.array(shifts)[key_pos]) % self.m
+        upper = is_upper[codes[letters]]
+        codes[letters] = np.where(upper, upper_codes[new_idx], lower_codes[new_idx])
+        return codes.tobytes().decode("utf-32-le")
+
+    def _transform_translate(self, text: str, shifts: list) -> str:
+        # parts = [буквы, прочее, буквы, прочее, ..., буквы]
+        parts = _letter_runs_pattern(self.lang).split(text)
+        runs = parts[0::2]
+        # в строке только буквы алфавита - она представима однобайтовой кодировкой
+        letters = "".join(runs).encode(self.codec)
+        shifted = bytearray(letters)
+        klen = len(shifts)
+        for r in range(min(klen, len(letters))):
+            shifted[r::klen] = letters[r::klen].translate(_shift_table(self.lang, shifts[r]))
+        shifted = shifted.decode(self.codec)
+        # возвращаем буквы на места исходных участков
+        bounds = [0, *itertools.accumulate(map(len, runs))]
+        parts[0::2] = [shifted[a:b] for a, b in zip(bounds, bounds[1:])]
+        return "".join(parts)
+
+    def _transform(self, text: str, shifts: list) -> str:
+        if np is not None:
+            return self._transform_numpy(text, shifts)
+        return self._transform_translate(text, shifts)
+
+    def encrypt(self, plaintext: str) -> str:
+        return self._transform(plaintext, self.shifts)
+
+    def decrypt(self, ciphertext: str) -> str:
+        return self._transform(ciphertext, [self.m - s for s in self.shifts])
+
+@lru_cache(maxsize=256)
+def get_context(key: str, lang: str="ru") -> CipherContext:
+    # контексты переиспользуются для повторяющихся пар (ключ, язык)
+    return CipherContext(key, lang)
+
+def vigenere_encrypt(plaintext: str, key: str, lang: str="ru") -> str:
+    return get_context(key, lang).encrypt(plaintext)
+
+def vigenere_decrypt(ciphertext: str, key: str, lang: str="ru") -> str:
+    return get_context(key, lang).decrypt(ciphertext)
@@ -3,7 +3,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from cipher import vigenere_encrypt, vigenere_decrypt
-from attack import brute_force
+from attack import brute_force, estimate_key_lengths, frequency_attack, parallel_brute_force
 import threading
 
 class VigenereGUI:
@@ -15,6 +15,9 @@ class VigenereGUI:
         self.max_key_len_var = tk.IntVar(value=3)
         self.known_plain_var = tk.StringVar()
         self.top_n_var = tk.IntVar(value=10)
+        self.attack_mode_var = tk.StringVar(value="brute")
+        self.parallel_var = tk.BooleanVar(value=True)
+        self.cancel_event = threading.Event()
 
         # Frames
         top = ttk.Frame(root, padding=10)
@@ -43,7 +46,10 @@ class VigenereGUI:
 
         # Attack controls
         ttk.Separator(top, orient="horizontal").grid(row=6, column=0, columnspan=4, sticky="ew", pady=8)
-        ttk.Label(top, text="Атака (brute-force):").grid(row=7, column=0, sticky="w")
+        ttk.Label(top, text="Атака:").grid(row=7, column=0, sticky="w")
+        ttk.Radiobutton(top, text="Перебор ключей", variable=self.attack_mode_var, value="brute").grid(row=7, column=1, sticky="w")
+        ttk.Radiobutton(top, text="Частотная (по столбцам)", variable=self.attack_mode_var, value="freq").grid(row=7, column=2, sticky="w")
+        ttk.Button(top, text="Оценить длину ключа", command=self.estimate_key_length).grid(row=7, column=3)
         ttk.Label(top, text="max длина ключа:").grid(row=8, column=0, sticky="e")
         ttk.Entry(top, textvariable=self.max_key_len_var, width=5).grid(row=8, column=1, sticky="w")
         ttk.Label(top, text="top N кандидатов:").grid(row=8, column=2, sticky="e")
@@ -56,6 +62,8 @@ class VigenereGUI:
 
         # Results table
         ttk.Label(top, text="Кандидаты: (score, key, plaintext preview)").grid(row=10, column=0, sticky="w")
+        ttk.Checkbutton(top, text="Перебор в нескольких процессах", variable=self.parallel_var).grid(row=10, column=1, columnspan=2, sticky="w")
+        ttk.Button(top, text="Остановить", command=self.cancel_event.set).grid(row=10, column=3)
         self.tree = ttk.Treeview(top, columns=("score", "key", "preview"), show="headings", height=8)
         self.tree.heading("score", text="score")
         self.tree.heading("key", text="key")
@@ -89,6 +97,21 @@ class VigenereGUI:
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def estimate_key_length(self):
+        # Касиски + индекс совпадений: вероятные длины ключа без перебора
+        ciphertext = self.txt_in.get("1.0", "end").rstrip("\n")
+        try:
+            ranked, friedman = estimate_key_lengths(ciphertext, lang=self.lang_var.get(),
+                                                     max_len=self.max_key_len_var.get())
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        lines = [f"Оценка Фридмана: {friedman:.1f}", "", "длина  оценка  IC столбцов  доля Касиски"]
+        for L, score, ic, kasiski in ranked:
+            lines.append(f"{L:>5}  {score:>6.2f}  {ic:>11.4f}  {kasiski:>12.2f}")
+        self.txt_out.delete("1.0", "end")
+        self.txt_out.insert("1.0", "\n".join(lines))
+
     def run_attack_thread(self):
         # запускаем брутфорс в отдельном потоке, чтобы GUI не завис
         t = threading.Thread(target=self.run_attack)
@@ -97,6 +120,7 @@ class VigenereGUI:
 
     def run_attack(self):
         self.btn_attack.config(state="disabled")
+        self.cancel_event.clear()
         self.tree.delete(*self.tree.get_children())
         ciphertext = self.txt_in.get("1.0", "end").rstrip("\n")
         if not ciphertext.strip():
@@ -107,24 +131,46 @@ class VigenereGUI:
         top_n = self.top_n_var.get()
         known = self.known_plain_var.get().strip() or None
         lang = self.lang_var.get()
-        # предупреждение для пользователя
-        if max_len > 5:
-            if not messagebox.askyesno("Warning", "max_key_len > 5 — пространство ключей очень велико. Продолжить?"):
+        if self.attack_mode_var.get() == "freq":
+            # частотная атака: длины ключа (до max_len) оцениваются автоматически, перебора нет
+            try:
+                res = frequency_attack(ciphertext, lang=lang, max_key_len=max_len, top_n=top_n,
+                                       known_plaintext=known)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
                 self.btn_attack.config(state="normal")
                 return
-        res = brute_force(ciphertext, lang=lang, max_key_len=max_len, top_n=top_n, known_plaintext=known)
+        else:
+            # предупреждение для пользователя
+            if max_len > 5:
+                if not messagebox.askyesno("Warning", "max_key_len > 5 — пространство ключей очень велико. Продолжить?"):
+                    self.btn_attack.config(state="normal")
+                    return
+            # текущий топ показывается по ходу перебора (таблицу обновляет поток GUI)
+            on_candidates = lambda cands, tested: self.root.after(0, self.show_candidates, cands)
+            if self.parallel_var.get():
+                res = parallel_brute_force(ciphertext, lang=lang, max_key_len=max_len, top_n=top_n, known_plaintext=known,
+                                           on_candidates=on_candidates, cancel_event=self.cancel_event)
+            else:
+                res = brute_force(ciphertext, lang=lang, max_key_len=max_len, top_n=top_n, known_plaintext=known,
+                                  on_candidates=on_candidates, stop_event=self.cancel_event)
         if res.get("found"):
             messagebox.showinfo("Found", f"Найден ключ: {res['key']}\nПример расшифровки в поле результата.")
             self.txt_out.delete("1.0", "end")
             self.txt_out.insert("1.0", res["plaintext"])
         else:
-            # показать кандидатов
-            for sc, key, dec in res.get("candidates", []):
-                preview = dec[:120].replace("\n", " ")
-                self.tree.insert("", "end", values=(f"{sc:.2f}", key, preview))
-            messagebox.showinfo("Done", f"Тестов: {res.get('tested', 'n/a')}. Топ кандидатов показан в таблице.")
+            # показать кандидатов (после уже поставленных в очередь промежуточных обновлений)
+            self.root.after(0, self.show_candidates, res.get("candidates", []))
+            status = "Атака остановлена" if res.get("cancelled") else "Готово"
+            messagebox.showinfo("Done", f"{status}. Тестов: {res.get('tested', 'n/a')}. Топ кандидатов показан в таблице.")
         self.btn_attack.config(state="normal")
 
+    def show_candidates(self, candidates):
+        self.tree.delete(*self.tree.get_children())
+        for sc, key, dec in candidates:
+            preview = dec[:120].replace("\n", " ")
+            self.tree.insert("", "end", values=(f"{sc:.2f}", key, preview))
+
     def on_candidate_select(self, event):
         sel = self.tree.selection()
         if not sel: return
@@ -0,0 +1,43 @@
+# test_attack.py
+# Проверки частотной атаки: python -m unittest test_attack (или pytest)
+
+import unittest
+
+from attack import estimate_key_lengths, frequency_attack
+from cipher import vigenere_encrypt
+
+PLAINTEXT = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, "
+    "it was the age of foolishness, it was the epoch of belief, it was the epoch of "
+    "incredulity, it was the season of light, it was the season of darkness, it was "
+    "the spring of hope, it was the winter of despair, we had everything before us, "
+    "we had nothing before us, we were all going direct to heaven, we were all going "
+    "direct the other way. There were a king with a large jaw and a queen with a plain "
+    "face, on the throne of England; there were a king with a large jaw and a queen "
+    "with a fair face, on the throne of France."
+)
+
+
+class FrequencyAttackTest(unittest.TestCase):
+    def test_true_length_ranked_second(self):
+        # каждая длина получает место в топе, даже если верная длина не первая
+        ciphertext = vigenere_encrypt(PLAINTEXT, "key", lang="en")
+        res = frequency_attack(ciphertext, lang="en", key_lengths=[7, 3], top_n=10)
+        keys = [key for _, key, _ in res["candidates"]]
+        self.assertFalse(res["found"])
+        self.assertIn("key", keys[:2])
+
+    def test_known_plaintext_on_second_length(self):
+        ciphertext = vigenere_encrypt(PLAINTEXT, "key", lang="en")
+        res = frequency_attack(ciphertext, lang="en", key_lengths=[7, 3], known_plaintext="season of light")
+        self.assertTrue(res["found"])
+        self.assertEqual(res["key"], "key")
+
+    def test_true_length_ranked_first_by_estimate(self):
+        ciphertext = vigenere_encrypt(PLAINTEXT, "key", lang="en")
+        ranked, _ = estimate_key_lengths(ciphertext, lang="en")
+        self.assertEqual(ranked[0][0], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
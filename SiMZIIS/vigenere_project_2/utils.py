@@ -15,9 +15,39 @@ ENG_FREQ = {
 RUS_FREQ = {
  'о':0.1097,'е':0.0845,'а':0.0801,'и':0.0735,'н':0.0670,'т':0.0626,'с':0.0547,'р':0.0473,'в':0.0454,'л':0.0434,
  'к':0.0349,'м':0.0321,'д':0.0298,'п':0.0281,'у':0.0262,'я':0.0201,'ы':0.0189,'ь':0.0174,'г':0.0169,'з':0.0165,
- 'б':0.0145,'ч':0.0121,'й':0.0094,'х':0.0090,'ж':0.0073,'ш':0.0063,'ю':0.0064,'ц':0.0048,'щ':0.0036,'э':0.0032,'ё':0.0004,'ъ':0.0004
+ 'б':0.0145,'ч':0.0121,'й':0.0094,'х':0.0090,'ж':0.0073,'ш':0.0063,'ю':0.0064,'ц':0.0048,'щ':0.0036,'э':0.0032,'ё':0.0004,'ъ':0.0004,'ф':0.0026
 }
 
+def get_freq_table(lang: str):
+    # алфавит (в порядке сортировки) и таблица частот языка
+    if lang.startswith("ru"):
+        return "".join(sorted(RUS_FREQ.keys())), RUS_FREQ
+    return "".join(sorted(ENG_FREQ.keys())), ENG_FREQ
+
+def language_ic(lang: str) -> float:
+    # индекс совпадений осмысленного текста: сумма квадратов частот букв
+    _, freq_map = get_freq_table(lang)
+    total = sum(freq_map.values())
+    return sum((p / total) ** 2 for p in freq_map.values())
+
+def index_of_coincidence(text: str) -> float:
+    # вероятность того, что две случайно выбранные буквы текста совпадают
+    n = len(text)
+    if n < 2:
+        return 0.0
+    counts = Counter(text)
+    return sum(c * (c - 1) for c in counts.values()) / (n * (n - 1))
+
+def friedman_estimate(ic: float, n: int, lang: str) -> float:
+    # оценка длины ключа по Фридману из индекса совпадений шифртекста (n букв)
+    alphabet, _ = get_freq_table(lang)
+    kp = language_ic(lang)
+    kr = 1.0 / len(alphabet)
+    denom = (n - 1) * ic - kr * n + kp
+    if denom <= 0:
+        return float('inf')
+    return (kp - kr) * n / denom
+
 def chi_squared_score(text: str, alphabet: str, freq_map: dict) -> float:
     # вычисляем chi-squared между частотой букв в тексте и эталонной частотой
     text = text.lower()
@@ -34,12 +64,7 @@ def chi_squared_score(text: str, alphabet: str, freq_map: dict) -> float:
     return chi2
 
 def suggest_top_candidates(candidates: list, lang: str, top_n: int=10):
-    if lang.startswith("ru"):
-        alphabet = "".join(sorted(RUS_FREQ.keys()))  # не важно порядок
-        freq_map = RUS_FREQ
-    else:
-        alphabet = "".join(sorted(ENG_FREQ.keys()))
-        freq_map = ENG_FREQ
+    alphabet, freq_map = get_freq_table(lang)
 
     scored = []
     for key, decrypted in candidates: